@@ -1,9 +1,13 @@
 from contextlib import contextmanager
 import os
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Optional
 
+from anyio import to_thread
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.sql import Executable
 
 
 def _database_url() -> str:
@@ -18,15 +22,62 @@ def _database_url() -> str:
 DATABASE_URL = _database_url()
 
 
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "20"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+DATABASE_POOL_TIMEOUT_SECONDS = float(os.getenv("DATABASE_POOL_TIMEOUT_SECONDS", "5"))
+DATABASE_POOL_RECYCLE_SECONDS = int(os.getenv("DATABASE_POOL_RECYCLE_SECONDS", "1800"))
+DATABASE_ASYNC_POOL_SIZE = int(os.getenv("DATABASE_ASYNC_POOL_SIZE", "5"))
+DATABASE_QUERY_CACHE_SIZE = int(os.getenv("DATABASE_QUERY_CACHE_SIZE", "1200"))
+DATABASE_POOL_CAPACITY: Optional[int] = (
+    None
+    if DATABASE_URL.startswith("sqlite")
+    else DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW
+)
+
+
 def _engine_kwargs() -> Dict[str, object]:
-    kwargs: Dict[str, object] = {"future": True, "echo": False}
+    kwargs: Dict[str, object] = {
+        "future": True,
+        "echo": False,
+        "query_cache_size": DATABASE_QUERY_CACHE_SIZE,
+    }
     if DATABASE_URL.startswith("sqlite"):
         kwargs["connect_args"] = {"check_same_thread": False}
+        kwargs["pool_pre_ping"] = True
+    else:
+        kwargs["pool_size"] = DATABASE_POOL_SIZE
+        kwargs["max_overflow"] = DATABASE_MAX_OVERFLOW
+        kwargs["pool_timeout"] = DATABASE_POOL_TIMEOUT_SECONDS
+        kwargs["pool_recycle"] = DATABASE_POOL_RECYCLE_SECONDS
+        kwargs["pool_pre_ping"] = True
     return kwargs
 
 
+def _create_async_engine() -> Optional[AsyncEngine]:
+    # psycopg 3 ships its own asyncio driver; SQLite has no async driver
+    # installed, so reads there fall back to the worker threadpool.
+    if not DATABASE_URL.startswith("postgresql+psycopg://"):
+        return None
+    return create_async_engine(
+        DATABASE_URL,
+        echo=False,
+        query_cache_size=DATABASE_QUERY_CACHE_SIZE,
+        pool_size=DATABASE_ASYNC_POOL_SIZE,
+        max_overflow=DATABASE_ASYNC_POOL_SIZE,
+        pool_timeout=DATABASE_POOL_TIMEOUT_SECONDS,
+        pool_recycle=DATABASE_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=True,
+    )
+
+
 engine = create_engine(DATABASE_URL, **_engine_kwargs())
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+async_engine = _create_async_engine()
+AsyncSessionLocal = (
+    async_sessionmaker(bind=async_engine, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
 
 Base = declarative_base()
 
@@ -42,3 +93,16 @@ def session_scope() -> Iterator[Session]:
         raise
     finally:
         session.close()
+
+
+def _read_all(statement: Executable) -> list[Row]:
+    with SessionLocal() as session:
+        return list(session.execute(statement))
+
+
+async def read_all(statement: Executable) -> list[Row]:
+    if AsyncSessionLocal is None:
+        return await to_thread.run_sync(_read_all, statement)
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(statement)
+        return list(result)
@@ -3,32 +3,47 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
 import logging
 import os
 import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Annotated, List, Optional
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Annotated, Iterator, List, Optional, Sequence, Union
 
-from fastapi import Depends, FastAPI, Form, HTTPException, Request, Response, status
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import BackgroundTasks, Depends, FastAPI, Form, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from markupsafe import Markup, escape
 from sqlalchemy.orm import Session
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import inspect, text
+from sqlalchemy import bindparam, delete, insert, inspect, select, text
+from sqlalchemy.engine import Connection, Row
 
 import httpx
-from pydantic import ValidationError
-
-from .database import Base, SessionLocal, engine
+import orjson
+from anyio import to_thread
+from pydantic import BaseModel, ValidationError
+
+from .database import (
+    DATABASE_POOL_CAPACITY,
+    Base,
+    SessionLocal,
+    async_engine,
+    engine,
+    read_all,
+)
 from .models import (
     ApprovalDecision,
     EventDelegate,
     InvitationRole,
     Organization,
     OrganizationInvitation,
+    SchemaMeta,
     SiteSettings,
     User,
     VotingAccessCode,
@@ -54,10 +69,13 @@ from .schemas import (
     OrganizationContactInfo,
     OrganizationCreateRequest,
     OrganizationDetail,
+    OrganizationSummary,
     OrganizationEventAssignment,
     OrganizationEventDelegate,
     OrganizationBillingUpdate,
     OrganizationFeeUpdate,
+    OrganizationMember,
+    OrganizationUpdateAck,
     OrganizationInvitationRead,
     OrganizationMembershipInfo,
     OrganizationRead,
@@ -87,7 +105,10 @@ from .schemas import (
     VotingO2AuthResponse,
 )
 from .services import (
+    AccountNotActiveError,
     AuthenticationError,
+    INVALID_LOGIN_MESSAGE,
+    NotFoundError,
     PasswordResetError,
     RegistrationError,
     accept_invitation,
@@ -103,6 +124,7 @@ from .services import (
     decide_registration,
     delegate_lock_state,
     delegates_for_event,
+    event_delegate_rows,
     delete_organization,
     delete_voting_event,
     delete_user_account,
@@ -113,20 +135,27 @@ from .services import (
     list_voting_events,
     upcoming_voting_events,
     list_admin_users,
+    ensure_user_can_log_in,
+    login_credentials_statement,
+    organization_member_count,
     organization_with_members,
+    iter_organization_members,
+    iter_organizations_with_members,
+    organization_list_cache,
     organizations_with_members,
-    pending_registrations,
+    pending_registrations_statement,
     queue_password_reset_email,
     queue_invitation_email,
     queue_admin_invitation_email,
     queue_verification_email,
     register_user,
     build_access_code_pdf,
+    cached_active_voting_event,
     reset_voting_events,
     remove_member_from_organization,
     generate_voting_access_codes,
     resolve_session_user,
-    search_organizations,
+    search_organizations_statement,
     set_active_voting_event,
     set_event_delegates_for_organization,
     set_delegate_lock_override,
@@ -145,25 +174,31 @@ from .services import (
     VotingAccessCodeError,
     VotingAccessCodeUnavailableError,
 )
-from .security import hash_password
+from .security import (
+    MAX_PASSWORD_BYTES,
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
 
 
 logger = logging.getLogger(__name__)
 
 templates = Jinja2Templates(directory="app/templates")
 
-ADMIN_EMAILS = {
-    email.strip().lower()
-    for email in os.getenv("ADMIN_EMAILS", "").split(",")
-    if email.strip()
-}
-
 ADMIN_EMAIL = os.getenv("ADMIN_EMAIL", "").strip().lower() or None
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "")
 ADMIN_FIRST_NAME = os.getenv("ADMIN_FIRST_NAME", "Rendszer").strip() or "Rendszer"
 ADMIN_LAST_NAME = os.getenv("ADMIN_LAST_NAME", "Adminisztrátor").strip() or "Adminisztrátor"
-if ADMIN_EMAIL:
-    ADMIN_EMAILS.add(ADMIN_EMAIL)
+ADMIN_EMAILS = frozenset(
+    {
+        email.strip().lower()
+        for email in os.getenv("ADMIN_EMAILS", "").split(",")
+        if email.strip()
+    }
+    | ({ADMIN_EMAIL} if ADMIN_EMAIL else set())
+)
 USER_REDIRECT_PATH = os.getenv("USER_REDIRECT_PATH", "/")
 ADMIN_REDIRECT_PATH = os.getenv("ADMIN_REDIRECT_PATH", "/admin")
 RECAPTCHA_SITE_KEY = os.getenv("RECAPTCHA_SITE_KEY", "").strip()
@@ -173,9 +208,14 @@ VOTING_O2AUTH_SECRET = (
     os.getenv("VOTING_O2AUTH_SECRET", "development-secret") or "development-secret"
 )
 VOTING_O2AUTH_TTL_SECONDS = int(os.getenv("VOTING_O2AUTH_TTL_SECONDS", "300"))
+EFFECTIVE_O2AUTH_TTL_SECONDS = (
+    VOTING_O2AUTH_TTL_SECONDS if VOTING_O2AUTH_TTL_SECONDS > 0 else 300
+)
 VOTING_APP_BASE_URL = (
     os.getenv("VOTING_APP_BASE_URL", "http://localhost:3001").strip() or "http://localhost:3001"
 )
+VOTING_O2AUTH_REDIRECT_PREFIX = f"{VOTING_APP_BASE_URL.rstrip('/')}/o2auth?token="
+VOTING_EVENT_SYNC_URL = f"{VOTING_APP_BASE_URL.rstrip('/')}/api/internal/event-sync"
 VOTING_AUTH_TTL_SECONDS = int(os.getenv("VOTING_AUTH_TTL_SECONDS", "60"))
 BREVO_API_KEY = os.getenv("BREVO_API_KEY", "").strip()
 _DEFAULT_BREVO_SENDER_EMAIL = "noreply@mikegyesulet.hu"
@@ -189,11 +229,52 @@ BREVO_SENDER_NAME = (
     or _DEFAULT_BREVO_SENDER_NAME
 )
 PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "").strip()
+EMAIL_DELIVERY_METHOD = "brevo" if BREVO_API_KEY and BREVO_SENDER_EMAIL else "noop"
 _VOTING_O2AUTH_SECRET_BYTES = VOTING_O2AUTH_SECRET.encode("utf-8")
+# Keyed once; copies reuse the inner/outer pad state instead of re-keying.
+_VOTING_O2AUTH_HMAC = hmac.new(_VOTING_O2AUTH_SECRET_BYTES, digestmod=hashlib.sha256)
 VOTING_SYNC_TIMEOUT_SECONDS = float(os.getenv("VOTING_SYNC_TIMEOUT_SECONDS", "5"))
+OUTBOUND_HTTP_MAX_CONNECTIONS = int(os.getenv("OUTBOUND_HTTP_MAX_CONNECTIONS", "20"))
+EMAIL_QUEUE_MAX_ENTRIES = 1000
+SCHEMA_VERSION = 5
+RUN_SCHEMA_MIGRATIONS = os.getenv("RUN_SCHEMA_MIGRATIONS", "1").strip() != "0"
+SCHEMA_MIGRATION_LOCK_KEY = 0x6D696B64
 PASSWORD_RESET_TOKEN_TTL_MINUTES = int(
     os.getenv("PASSWORD_RESET_TOKEN_TTL_MINUTES", "60")
 )
+STATIC_DIRECTORY = Path("app/static")
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=300"
+STATIC_LOOKUP_CACHE_SIZE = 1024
+STATIC_PAGE_FILES = (
+    "login.html",
+    "register.html",
+    "invitation-accept.html",
+    "password-change.html",
+    "admin-overview.html",
+    "admin-organizations.html",
+    "admin-pending.html",
+    "admin-events.html",
+    "admin-users.html",
+    "admin-settings.html",
+    "member-unpaid.html",
+    "member-home.html",
+    "member-members.html",
+    "member-voting.html",
+    "member-financials.html",
+)
+
+
+def _load_static_pages() -> dict[str, tuple[bytes, str, dict[str, str]]]:
+    pages: dict[str, tuple[bytes, str, dict[str, str]]] = {}
+    for filename in STATIC_PAGE_FILES:
+        content = (STATIC_DIRECTORY / filename).read_bytes()
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": STATIC_PAGE_CACHE_CONTROL}
+        pages[filename] = (content, etag, headers)
+    return pages
+
+
+_STATIC_PAGE_CACHE = _load_static_pages()
 
 
 def _serialize_datetime(value):
@@ -242,13 +323,12 @@ def _build_voting_sync_payload(event: VotingEvent | None) -> dict:
 
 def _sync_voting_service(event: VotingEvent | None) -> None:
     payload = _build_voting_sync_payload(event)
-    canonical = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-    timestamp = int(time.time())
-    signature_payload = f"{timestamp}:{canonical}".encode("utf-8")
-    signature = hmac.new(
-        _VOTING_O2AUTH_SECRET_BYTES, signature_payload, hashlib.sha256
-    ).hexdigest()
-    url = f"{VOTING_APP_BASE_URL.rstrip('/')}/api/internal/event-sync"
+    # The voting service re-serializes the parsed body with JSON.stringify,
+    # which keeps key order and writes non-ASCII as UTF-8, so the exact bytes
+    # that are signed are also the bytes that are sent.
+    body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    timestamp = time.time_ns() // 1_000_000_000
+    signature = _sign_o2auth(f"{timestamp}:".encode("ascii") + body)
     headers = {
         "accept": "application/json",
         "content-type": "application/json",
@@ -258,8 +338,8 @@ def _sync_voting_service(event: VotingEvent | None) -> None:
 
     try:
         response = httpx.post(
-            url,
-            json=payload,
+            VOTING_EVENT_SYNC_URL,
+            content=body,
             headers=headers,
             timeout=VOTING_SYNC_TIMEOUT_SECONDS,
         )
@@ -272,56 +352,205 @@ def _sync_active_event(db: Session) -> None:
     active_event = get_active_voting_event(db)
     _sync_voting_service(active_event)
 
-app = FastAPI(title="MIK Dashboard Registration Service")
+
+def _sync_active_event_in_background() -> None:
+    with SessionLocal() as session:
+        _sync_active_event(session)
+
+
+class PydanticResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: BaseModel | list[BaseModel]) -> bytes:
+        if isinstance(content, BaseModel):
+            return orjson.dumps(content.dict(by_alias=True))
+        return orjson.dumps([item.dict(by_alias=True) for item in content])
+
+
+app = FastAPI(
+    title="MIK Dashboard Registration Service",
+    default_response_class=ORJSONResponse,
+)
 
 
 @app.on_event("startup")
 def startup() -> None:
-    Base.metadata.create_all(bind=engine)
-    ensure_fee_paid_column()
-    ensure_billing_columns()
+    if RUN_SCHEMA_MIGRATIONS:
+        migrate_schema()
     ensure_site_settings_row()
-    ensure_is_admin_column()
-    ensure_voting_delegate_column()
-    ensure_must_change_password_column()
-    ensure_seed_password_changed_column()
-    ensure_organization_contact_column()
-    ensure_nullable_organization_column()
-    ensure_name_columns()
-    ensure_event_metadata_columns()
-    ensure_delegate_uniqueness_constraints()
     seed_admin_user()
-    app.state.email_queue = []
+    app.state.email_queue = deque(maxlen=EMAIL_QUEUE_MAX_ENTRIES)
+    app.state.http_client = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(
+            max_connections=OUTBOUND_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=OUTBOUND_HTTP_MAX_CONNECTIONS,
+        ),
+    )
+    # Builds and caches the model schemas so the first /docs request does not.
+    app.openapi()
 
 
-def ensure_fee_paid_column() -> None:
+@app.on_event("startup")
+async def limit_threadpool_to_database_pool() -> None:
+    # Sync endpoints each hold a pooled connection on a worker thread; more
+    # threads than connections would only queue on the pool checkout timeout.
+    if DATABASE_POOL_CAPACITY is not None:
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = min(limiter.total_tokens, DATABASE_POOL_CAPACITY)
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def migrate_schema() -> None:
     with engine.begin() as connection:
+        lock_schema_migrations(connection)
+        if read_schema_version(connection) == SCHEMA_VERSION:
+            return
+        Base.metadata.create_all(bind=connection)
+        ensure_schema(connection)
+        write_schema_version(connection)
+
+
+def lock_schema_migrations(connection: Connection) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"),
+            {"key": SCHEMA_MIGRATION_LOCK_KEY},
+        )
+
+
+def read_schema_version(connection: Connection) -> Optional[int]:
+    if not inspect(connection).has_table(SchemaMeta.__tablename__):
+        return None
+    return connection.execute(
+        select(SchemaMeta.version).where(SchemaMeta.id == 1)
+    ).scalar_one_or_none()
+
+
+def write_schema_version(connection: Connection) -> None:
+    connection.execute(delete(SchemaMeta))
+    connection.execute(insert(SchemaMeta).values(id=1, version=SCHEMA_VERSION))
+
+
+def schema_columns(
+    connection: Connection, tables: Sequence[str]
+) -> dict[str, dict[str, bool]]:
+    columns: dict[str, dict[str, bool]] = {table: {} for table in tables}
+    if connection.dialect.name != "postgresql":
         inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("organizations")}
-        if "fee_paid" not in columns:
+        for table in tables:
+            for column in inspector.get_columns(table):
+                columns[table][column["name"]] = column.get("nullable", True)
+        return columns
+
+    # One information_schema query instead of a full reflection per table.
+    rows = connection.execute(
+        text(
+            "SELECT table_name, column_name, is_nullable "
+            "FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name IN :tables"
+        ).bindparams(bindparam("tables", expanding=True)),
+        {"tables": list(tables)},
+    )
+    for table_name, column_name, is_nullable in rows:
+        columns[table_name][column_name] = is_nullable == "YES"
+    return columns
+
+
+def ensure_schema(connection: Connection) -> None:
+    columns = schema_columns(connection, ("organizations", "users", "voting_events"))
+    organization_columns = set(columns["organizations"])
+    user_columns = set(columns["users"])
+    event_columns = set(columns["voting_events"])
+
+    ensure_fee_paid_column(connection, organization_columns)
+    ensure_billing_columns(connection, organization_columns)
+    ensure_is_admin_column(connection, user_columns)
+    ensure_voting_delegate_column(connection, user_columns)
+    ensure_must_change_password_column(connection, user_columns)
+    ensure_seed_password_changed_column(connection, user_columns)
+    ensure_organization_contact_column(connection, user_columns)
+    ensure_nullable_organization_column(connection, columns["users"])
+    ensure_name_columns(connection, user_columns)
+    ensure_event_metadata_columns(connection, event_columns)
+    ensure_delegate_uniqueness_constraints(connection)
+    ensure_organization_cascade_foreign_keys(connection)
+    ensure_indexes(connection)
+    ensure_timestamp_defaults(connection)
+
+
+def ensure_indexes(connection: Connection) -> None:
+    # Older databases may hold duplicate pending invitations, which would make
+    # the unique pending-invitation index fail; keep only the newest of each.
+    connection.execute(
+        text(
+            "DELETE FROM organization_invitations "
+            "WHERE accepted_at IS NULL AND id NOT IN ("
+            "SELECT MAX(id) FROM organization_invitations "
+            "WHERE accepted_at IS NULL "
+            "GROUP BY organization_id, LOWER(email), role)"
+        )
+    )
+    # create_all only adds indexes together with new tables.
+    for table in (
+        User.__table__,
+        EventDelegate.__table__,
+        OrganizationInvitation.__table__,
+    ):
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def ensure_timestamp_defaults(connection: Connection) -> None:
+    # SQLite cannot change a column default in place; the models fill the
+    # timestamps from Python there instead.
+    if connection.dialect.name != "postgresql":
+        return
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if column.name not in {"created_at", "updated_at"}:
+                continue
+            if column.server_default is None:
+                continue
+            default = column.server_default.arg.compile(dialect=connection.dialect)
             connection.execute(
                 text(
-                    "ALTER TABLE organizations ADD COLUMN fee_paid BOOLEAN NOT NULL DEFAULT FALSE"
+                    f"ALTER TABLE {table.name} ALTER COLUMN {column.name} "
+                    f"SET DEFAULT {default}"
                 )
             )
 
 
-def ensure_billing_columns() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("organizations")}
-        if "bank_name" not in columns:
-            connection.execute(
-                text("ALTER TABLE organizations ADD COLUMN bank_name VARCHAR")
-            )
-        if "bank_account_number" not in columns:
-            connection.execute(
-                text("ALTER TABLE organizations ADD COLUMN bank_account_number VARCHAR")
-            )
-        if "payment_instructions" not in columns:
-            connection.execute(
-                text("ALTER TABLE organizations ADD COLUMN payment_instructions VARCHAR")
+def ensure_fee_paid_column(connection: Connection, columns: set[str]) -> None:
+    if "fee_paid" not in columns:
+        connection.execute(
+            text(
+                "ALTER TABLE organizations ADD COLUMN fee_paid BOOLEAN NOT NULL DEFAULT FALSE"
             )
+        )
+
+
+def ensure_billing_columns(connection: Connection, columns: set[str]) -> None:
+    if "bank_name" not in columns:
+        connection.execute(
+            text("ALTER TABLE organizations ADD COLUMN bank_name VARCHAR")
+        )
+    if "bank_account_number" not in columns:
+        connection.execute(
+            text("ALTER TABLE organizations ADD COLUMN bank_account_number VARCHAR")
+        )
+    if "payment_instructions" not in columns:
+        connection.execute(
+            text("ALTER TABLE organizations ADD COLUMN payment_instructions VARCHAR")
+        )
 
 
 def ensure_site_settings_row() -> None:
@@ -333,143 +562,168 @@ def ensure_site_settings_row() -> None:
         db.close()
 
 
-def ensure_is_admin_column() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("users")}
-        if "is_admin" not in columns:
-            connection.execute(
-                text(
-                    "ALTER TABLE users ADD COLUMN is_admin BOOLEAN NOT NULL DEFAULT FALSE"
-                )
+def ensure_is_admin_column(connection: Connection, columns: set[str]) -> None:
+    if "is_admin" not in columns:
+        connection.execute(
+            text(
+                "ALTER TABLE users ADD COLUMN is_admin BOOLEAN NOT NULL DEFAULT FALSE"
             )
+        )
 
 
-def ensure_voting_delegate_column() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("users")}
-        if "is_voting_delegate" not in columns:
-            connection.execute(
-                text(
-                    "ALTER TABLE users ADD COLUMN is_voting_delegate BOOLEAN NOT NULL DEFAULT FALSE"
-                )
+def ensure_voting_delegate_column(connection: Connection, columns: set[str]) -> None:
+    if "is_voting_delegate" not in columns:
+        connection.execute(
+            text(
+                "ALTER TABLE users ADD COLUMN is_voting_delegate BOOLEAN NOT NULL DEFAULT FALSE"
             )
+        )
 
 
-def ensure_must_change_password_column() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("users")}
-        if "must_change_password" not in columns:
-            connection.execute(
-                text(
-                    "ALTER TABLE users ADD COLUMN must_change_password BOOLEAN NOT NULL DEFAULT FALSE"
-                )
+def ensure_must_change_password_column(connection: Connection, columns: set[str]) -> None:
+    if "must_change_password" not in columns:
+        connection.execute(
+            text(
+                "ALTER TABLE users ADD COLUMN must_change_password BOOLEAN NOT NULL DEFAULT FALSE"
             )
+        )
 
 
-def ensure_seed_password_changed_column() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("users")}
-        if "seed_password_changed_at" not in columns:
-            connection.execute(
-                text("ALTER TABLE users ADD COLUMN seed_password_changed_at TIMESTAMP")
-            )
-            connection.execute(
-                text(
-                    "UPDATE users SET seed_password_changed_at = updated_at "
-                    "WHERE is_admin = TRUE AND must_change_password = FALSE"
-                )
+def ensure_seed_password_changed_column(connection: Connection, columns: set[str]) -> None:
+    if "seed_password_changed_at" not in columns:
+        connection.execute(
+            text("ALTER TABLE users ADD COLUMN seed_password_changed_at TIMESTAMP")
+        )
+        connection.execute(
+            text(
+                "UPDATE users SET seed_password_changed_at = updated_at "
+                "WHERE is_admin = TRUE AND must_change_password = FALSE"
             )
+        )
 
 
-def ensure_organization_contact_column() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("users")}
-        if "is_organization_contact" not in columns:
-            connection.execute(
-                text(
-                    "ALTER TABLE users ADD COLUMN is_organization_contact BOOLEAN NOT NULL DEFAULT FALSE"
-                )
+def ensure_organization_contact_column(connection: Connection, columns: set[str]) -> None:
+    if "is_organization_contact" not in columns:
+        connection.execute(
+            text(
+                "ALTER TABLE users ADD COLUMN is_organization_contact BOOLEAN NOT NULL DEFAULT FALSE"
             )
+        )
 
 
-def ensure_nullable_organization_column() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        for column in inspector.get_columns("users"):
-            if column["name"] == "organization_id" and not column.get("nullable", True):
-                connection.execute(
-                    text("ALTER TABLE users ALTER COLUMN organization_id DROP NOT NULL")
-                )
-                break
+def ensure_nullable_organization_column(
+    connection: Connection, user_columns: dict[str, bool]
+) -> None:
+    if not user_columns.get("organization_id", True):
+        connection.execute(
+            text("ALTER TABLE users ALTER COLUMN organization_id DROP NOT NULL")
+        )
 
 
-def ensure_name_columns() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("users")}
-        if "first_name" not in columns:
-            connection.execute(text("ALTER TABLE users ADD COLUMN first_name VARCHAR"))
-        if "last_name" not in columns:
-            connection.execute(text("ALTER TABLE users ADD COLUMN last_name VARCHAR"))
+def ensure_name_columns(connection: Connection, columns: set[str]) -> None:
+    if "first_name" not in columns:
+        connection.execute(text("ALTER TABLE users ADD COLUMN first_name VARCHAR"))
+    if "last_name" not in columns:
+        connection.execute(text("ALTER TABLE users ADD COLUMN last_name VARCHAR"))
 
 
-def ensure_event_metadata_columns() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        columns = {column["name"] for column in inspector.get_columns("voting_events")}
-        if "event_date" not in columns:
-            connection.execute(text("ALTER TABLE voting_events ADD COLUMN event_date TIMESTAMP"))
-        if "delegate_deadline" not in columns:
-            connection.execute(
-                text("ALTER TABLE voting_events ADD COLUMN delegate_deadline TIMESTAMP")
-            )
-        if "is_voting_enabled" not in columns:
-            connection.execute(
-                text(
-                    "ALTER TABLE voting_events ADD COLUMN is_voting_enabled BOOLEAN NOT NULL DEFAULT FALSE"
-                )
+def ensure_event_metadata_columns(connection: Connection, columns: set[str]) -> None:
+    if "event_date" not in columns:
+        connection.execute(text("ALTER TABLE voting_events ADD COLUMN event_date TIMESTAMP"))
+    if "delegate_deadline" not in columns:
+        connection.execute(
+            text("ALTER TABLE voting_events ADD COLUMN delegate_deadline TIMESTAMP")
+        )
+    if "is_voting_enabled" not in columns:
+        connection.execute(
+            text(
+                "ALTER TABLE voting_events ADD COLUMN is_voting_enabled BOOLEAN NOT NULL DEFAULT FALSE"
             )
-        if "delegate_limit" not in columns:
-            connection.execute(
-                text("ALTER TABLE voting_events ADD COLUMN delegate_limit INTEGER")
+        )
+    if "delegate_limit" not in columns:
+        connection.execute(
+            text("ALTER TABLE voting_events ADD COLUMN delegate_limit INTEGER")
+        )
+    if "delegate_lock_override" not in columns:
+        connection.execute(
+            text("ALTER TABLE voting_events ADD COLUMN delegate_lock_override VARCHAR")
+        )
+
+
+def ensure_delegate_uniqueness_constraints(connection: Connection) -> None:
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        exists = connection.execute(
+            text(
+                "SELECT 1 FROM information_schema.table_constraints "
+                "WHERE table_schema = current_schema() "
+                "AND table_name = 'event_delegates' "
+                "AND constraint_name = 'uq_event_org' "
+                "AND constraint_type = 'UNIQUE'"
             )
-        if "delegate_lock_override" not in columns:
+        ).first()
+        if exists is not None:
             connection.execute(
-                text("ALTER TABLE voting_events ADD COLUMN delegate_lock_override VARCHAR")
+                text("ALTER TABLE event_delegates DROP CONSTRAINT uq_event_org")
             )
+        return
 
+    constraint_names = {
+        constraint["name"]
+        for constraint in inspect(connection).get_unique_constraints("event_delegates")
+    }
+    if "uq_event_org" not in constraint_names:
+        return
+    if dialect == "sqlite":
+        connection.execute(text("DROP INDEX IF EXISTS uq_event_org"))
+    else:
+        connection.execute(text("ALTER TABLE event_delegates DROP CONSTRAINT uq_event_org"))
 
-def ensure_delegate_uniqueness_constraints() -> None:
-    with engine.begin() as connection:
-        inspector = inspect(connection)
-        constraint_names = {
-            constraint["name"] for constraint in inspector.get_unique_constraints("event_delegates")
-        }
-        if "uq_event_org" not in constraint_names:
-            return
 
-        dialect = connection.dialect.name
-        if dialect == "sqlite":
-            connection.execute(text("DROP INDEX IF EXISTS uq_event_org"))
-        else:
-            connection.execute(text("ALTER TABLE event_delegates DROP CONSTRAINT uq_event_org"))
+def ensure_organization_cascade_foreign_keys(connection: Connection) -> None:
+    # SQLite cannot alter a foreign key in place and does not enforce them by
+    # default; delete_organization removes the children itself there.
+    if connection.dialect.name != "postgresql":
+        return
+    rows = connection.execute(
+        text(
+            "SELECT tc.table_name, tc.constraint_name "
+            "FROM information_schema.table_constraints tc "
+            "JOIN information_schema.key_column_usage kcu "
+            "ON kcu.constraint_schema = tc.constraint_schema "
+            "AND kcu.constraint_name = tc.constraint_name "
+            "JOIN information_schema.referential_constraints rc "
+            "ON rc.constraint_schema = tc.constraint_schema "
+            "AND rc.constraint_name = tc.constraint_name "
+            "WHERE tc.table_schema = current_schema() "
+            "AND tc.constraint_type = 'FOREIGN KEY' "
+            "AND tc.table_name IN ('event_delegates', 'organization_invitations') "
+            "AND kcu.column_name = 'organization_id' "
+            "AND rc.delete_rule <> 'CASCADE'"
+        )
+    ).all()
+    for table_name, constraint_name in rows:
+        connection.execute(
+            text(
+                f'ALTER TABLE {table_name} DROP CONSTRAINT "{constraint_name}", '
+                f'ADD CONSTRAINT "{constraint_name}" FOREIGN KEY (organization_id) '
+                "REFERENCES organizations (id) ON DELETE CASCADE"
+            )
+        )
 
 
-def _base64url_encode(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+def _sign_o2auth(message: bytes) -> str:
+    signer = _VOTING_O2AUTH_HMAC.copy()
+    signer.update(message)
+    return signer.hexdigest()
 
 
-def _effective_o2auth_ttl() -> int:
-    return VOTING_O2AUTH_TTL_SECONDS if VOTING_O2AUTH_TTL_SECONDS > 0 else 300
+def _base64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
 
 def _validate_voting_auth_request(payload: VotingAuthRequest) -> None:
-    now = int(time.time())
+    now = time.time_ns() // 1_000_000_000
     if abs(now - payload.timestamp) > max(VOTING_AUTH_TTL_SECONDS, 1):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -481,9 +735,7 @@ def _validate_voting_auth_request(payload: VotingAuthRequest) -> None:
     message = (
         f"{payload.timestamp}:{canonical_email}:{payload.password}:{normalized_code}"
     ).encode("utf-8")
-    expected_signature = hmac.new(
-        _VOTING_O2AUTH_SECRET_BYTES, message, hashlib.sha256
-    ).hexdigest()
+    expected_signature = _sign_o2auth(message)
     provided_signature = payload.signature.strip().lower()
     if not hmac.compare_digest(expected_signature, provided_signature):
         raise HTTPException(
@@ -492,6 +744,43 @@ def _validate_voting_auth_request(payload: VotingAuthRequest) -> None:
         )
 
 
+def _encode_o2auth_body(
+    *,
+    uid: int,
+    org: int,
+    email: str,
+    role: str,
+    exp: int,
+    first_name: Optional[str],
+    last_name: Optional[str],
+    event_id: int,
+    event_title: str,
+    event_date: Optional[str],
+    delegate_deadline: Optional[str],
+    is_voting_enabled: bool,
+    delegate_count: int,
+    view: Optional[str] = None,
+) -> bytes:
+    claims = {
+        "uid": uid,
+        "org": org,
+        "email": email,
+        "role": role,
+        "exp": exp,
+        "first_name": first_name,
+        "last_name": last_name,
+        "event": event_id,
+        "event_title": event_title,
+        "event_date": event_date,
+        "delegate_deadline": delegate_deadline,
+        "is_voting_enabled": is_voting_enabled,
+        "delegate_count": delegate_count,
+    }
+    if view is not None:
+        claims["view"] = view
+    return orjson.dumps(claims, option=orjson.OPT_SORT_KEYS)
+
+
 def generate_voting_o2auth_token(
     user: User,
     organization: Organization,
@@ -499,65 +788,51 @@ def generate_voting_o2auth_token(
     *,
     view: str = "default",
 ) -> str:
-    ttl = _effective_o2auth_ttl()
-    payload = {
-        "uid": user.id,
-        "org": organization.id,
-        "email": user.email,
-        "role": "admin" if user.is_admin else "voter",
-        "exp": int(time.time()) + ttl,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "event": event.id,
-        "event_title": event.title,
-        "event_date": event.event_date.isoformat() if event.event_date else None,
-        "delegate_deadline": (
+    body = _encode_o2auth_body(
+        uid=user.id,
+        org=organization.id,
+        email=user.email,
+        role="admin" if user.is_admin else "voter",
+        exp=time.time_ns() // 1_000_000_000 + EFFECTIVE_O2AUTH_TTL_SECONDS,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        event_id=event.id,
+        event_title=event.title,
+        event_date=event.event_date.isoformat() if event.event_date else None,
+        delegate_deadline=(
             event.delegate_deadline.isoformat() if event.delegate_deadline else None
         ),
-        "is_voting_enabled": event.is_voting_enabled,
-        "delegate_count": event_delegate_count(event),
-    }
-    if view and view != "default":
-        payload["view"] = view
-    body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    signature = hmac.new(_VOTING_O2AUTH_SECRET_BYTES, body, hashlib.sha256).hexdigest()
+        is_voting_enabled=bool(event.is_voting_enabled),
+        delegate_count=event_delegate_count(event),
+        view=view if view and view != "default" else None,
+    )
+    signature = _sign_o2auth(body)
     return f"{_base64url_encode(body)}.{signature}"
 
 
 def build_voting_redirect_url(token: str, *, view: str = "default") -> str:
-    base = VOTING_APP_BASE_URL.rstrip("/")
-    query = f"token={token}"
     if view and view != "default":
-        query = f"{query}&view={view}"
-    return f"{base}/o2auth?{query}"
+        return f"{VOTING_O2AUTH_REDIRECT_PREFIX}{token}&view={view}"
+    return VOTING_O2AUTH_REDIRECT_PREFIX + token
 
 
 def seed_admin_user() -> None:
     if not ADMIN_EMAIL or not ADMIN_PASSWORD:
         return
+    if len(ADMIN_PASSWORD.encode("utf-8")) > MAX_PASSWORD_BYTES:
+        logger.warning(
+            "ADMIN_PASSWORD is longer than %s bytes; skipping admin seeding",
+            MAX_PASSWORD_BYTES,
+        )
+        return
 
     with SessionLocal() as session:
         existing = (
             session.query(User).filter(User.email == ADMIN_EMAIL).one_or_none()
         )
 
-        salt, password_hash = hash_password(ADMIN_PASSWORD)
-
-        if existing:
-            if existing.seed_password_changed_at is None:
-                existing.password_salt = salt
-                existing.password_hash = password_hash
-                existing.must_change_password = True
-                existing.seed_password_changed_at = None
-
-            existing.organization = None
-            existing.is_admin = True
-            existing.is_email_verified = True
-            existing.admin_decision = ApprovalDecision.approved
-            existing.first_name = ADMIN_FIRST_NAME
-            existing.last_name = ADMIN_LAST_NAME
-            existing.is_voting_delegate = True
-        else:
+        if existing is None:
+            salt, password_hash = hash_password(ADMIN_PASSWORD)
             user = User(
                 email=ADMIN_EMAIL,
                 first_name=ADMIN_FIRST_NAME,
@@ -573,8 +848,38 @@ def seed_admin_user() -> None:
                 seed_password_changed_at=None,
             )
             session.add(user)
+            session.commit()
+            return
+
+        if existing.seed_password_changed_at is None and not (
+            existing.must_change_password
+            and _seed_password_is_current(existing)
+        ):
+            salt, password_hash = hash_password(ADMIN_PASSWORD)
+            existing.password_salt = salt
+            existing.password_hash = password_hash
+            existing.must_change_password = True
+
+        if existing.organization_id is not None:
+            existing.organization = None
+        for attribute, value in (
+            ("is_admin", True),
+            ("is_email_verified", True),
+            ("admin_decision", ApprovalDecision.approved),
+            ("first_name", ADMIN_FIRST_NAME),
+            ("last_name", ADMIN_LAST_NAME),
+            ("is_voting_delegate", True),
+        ):
+            if getattr(existing, attribute) != value:
+                setattr(existing, attribute, value)
+
+        if session.dirty:
+            session.commit()
 
-        session.commit()
+
+def _seed_password_is_current(user: User) -> bool:
+    check = verify_password(ADMIN_PASSWORD, user.password_salt, user.password_hash)
+    return check.is_valid and not check.needs_rehash
 
 
 def get_db() -> Session:
@@ -633,7 +938,12 @@ def get_session_user(
     return user
 
 
-def require_admin(user: Annotated[User, Depends(get_session_user)]) -> User:
+CurrentUserDependency = Annotated[User, Depends(get_session_user)]
+
+
+async def require_admin(user: CurrentUserDependency) -> User:
+    # Only reads an attribute loaded with the session user, so it runs on the
+    # event loop instead of taking a threadpool hop per admin request.
     if not user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -642,6 +952,16 @@ def require_admin(user: Annotated[User, Depends(get_session_user)]) -> User:
     return user
 
 
+AdminUserDependency = Annotated[User, Depends(require_admin)]
+
+
+def get_request_active_event(db: DatabaseDependency) -> VotingEvent | None:
+    return get_active_voting_event(db)
+
+
+ActiveEventDependency = Annotated[Optional[VotingEvent], Depends(get_request_active_event)]
+
+
 def membership_info(
     organization: Organization | None,
     *,
@@ -662,6 +982,27 @@ def membership_info(
     )
 
 
+def registration_error_status(exc: RegistrationError) -> int:
+    if isinstance(exc, NotFoundError):
+        return status.HTTP_404_NOT_FOUND
+    return status.HTTP_400_BAD_REQUEST
+
+
+@contextmanager
+def registration_transaction(
+    db: Session, *, status_code: int | None = None
+) -> Iterator[None]:
+    try:
+        yield
+    except RegistrationError as exc:
+        db.rollback()
+        raise HTTPException(
+            status_code=status_code or registration_error_status(exc),
+            detail=str(exc),
+        ) from exc
+    db.commit()
+
+
 def ensure_organization_membership(user: User, organization_id: int) -> None:
     if user.is_admin:
         return
@@ -703,7 +1044,7 @@ def active_event_info(event: VotingEvent | None) -> ActiveEventInfo | None:
         return None
     lock_state = delegate_lock_state(event)
     total_codes, available_codes, used_codes = event_access_code_counts(event)
-    return ActiveEventInfo(
+    return ActiveEventInfo.construct(
         id=event.id,
         title=event.title,
         description=event.description,
@@ -722,27 +1063,33 @@ def active_event_info(event: VotingEvent | None) -> ActiveEventInfo | None:
     )
 
 
-def build_member_payload(member: User, organization: Organization) -> dict:
-    has_access = (
-        member.is_admin
+def build_member_payloads(organization: Organization) -> list[OrganizationMember]:
+    # The shared fee flag is read once per organization, not per member.
+    fee_paid = organization.fee_paid
+    return [
+        build_member_payload(member, fee_paid=fee_paid)
+        for member in organization.users
+    ]
+
+
+def build_member_payload(member: User, *, fee_paid: bool) -> OrganizationMember:
+    return OrganizationMember.construct(
+        id=member.id,
+        email=member.email,
+        first_name=member.first_name,
+        last_name=member.last_name,
+        is_admin=member.is_admin,
+        is_email_verified=member.is_email_verified,
+        admin_decision=member.admin_decision,
+        has_access=member.is_admin
         or (
-            member.is_email_verified
-            and member.admin_decision == ApprovalDecision.approved
-            and organization.fee_paid
-        )
+            fee_paid
+            and member.is_email_verified
+            and member.admin_decision is ApprovalDecision.approved
+        ),
+        is_voting_delegate=member.is_voting_delegate,
+        is_contact=member.is_organization_contact,
     )
-    return {
-        "id": member.id,
-        "email": member.email,
-        "first_name": member.first_name,
-        "last_name": member.last_name,
-        "is_admin": member.is_admin,
-        "is_email_verified": member.is_email_verified,
-        "admin_decision": member.admin_decision,
-        "has_access": has_access,
-        "is_voting_delegate": member.is_voting_delegate,
-        "is_contact": member.is_organization_contact,
-    }
 
 
 def build_invitation_payload(invitation: OrganizationInvitation) -> dict:
@@ -779,7 +1126,7 @@ def build_organization_event_assignment(
         if user is None:
             continue
         entries.append(
-            OrganizationEventDelegate(
+            OrganizationEventDelegate.construct(
                 user_id=user.id,
                 email=user.email,
                 first_name=user.first_name,
@@ -791,7 +1138,7 @@ def build_organization_event_assignment(
     lock_state = delegate_lock_state(event, current_time=current_time)
     can_manage = not lock_state.locked
 
-    return OrganizationEventAssignment(
+    return OrganizationEventAssignment.construct(
         event_id=event.id,
         title=event.title,
         description=event.description,
@@ -818,7 +1165,45 @@ def build_organization_detail(
     events: list[VotingEvent] | None = None,
     settings: Optional[SiteSettings] = None,
 ) -> OrganizationDetail:
-    members = [build_member_payload(member, organization) for member in organization.users]
+    return _build_organization_detail(
+        organization,
+        active_event=active_event,
+        active_info=active_event_info(active_event),
+        events=events,
+        settings=settings,
+    )
+
+
+def build_organization_details(
+    organizations: Sequence[Organization],
+    *,
+    active_event: VotingEvent | None,
+    settings: Optional[SiteSettings] = None,
+) -> list[OrganizationDetail]:
+    # The active event summary walks every delegate and access code, so it is
+    # built once and shared by all organizations in the list.
+    active_info = active_event_info(active_event)
+    return [
+        _build_organization_detail(
+            organization,
+            active_event=active_event,
+            active_info=active_info,
+            events=None,
+            settings=settings,
+        )
+        for organization in organizations
+    ]
+
+
+def _build_organization_detail(
+    organization: Organization,
+    *,
+    active_event: VotingEvent | None,
+    active_info: ActiveEventInfo | None,
+    events: list[VotingEvent] | None,
+    settings: Optional[SiteSettings],
+) -> OrganizationDetail:
+    members = build_member_payloads(organization)
     active_delegate_user_ids: list[int] = []
     if active_event is not None:
         for delegate in organization.event_delegates:
@@ -828,7 +1213,7 @@ def build_organization_detail(
     active_delegate_user_id = (
         active_delegate_user_ids[0] if active_delegate_user_ids else None
     )
-    contact_member = next((member for member in members if member.get("is_contact")), None)
+    contact_member = next((member for member in members if member.is_contact), None)
     contact_invitation_payload: dict | None = None
     for invitation in getattr(organization, "invitations", []) or []:
         if invitation.role == InvitationRole.contact and invitation.accepted_at is None:
@@ -840,7 +1225,7 @@ def build_organization_detail(
         contact_status = "invited"
     else:
         contact_status = "missing"
-    contact_info = OrganizationContactInfo(
+    contact_info = OrganizationContactInfo.construct(
         status=contact_status,
         user=contact_member,
         invitation=contact_invitation_payload,
@@ -865,7 +1250,7 @@ def build_organization_detail(
         organization, settings=settings
     )
 
-    return OrganizationDetail(
+    return OrganizationDetail.construct(
         id=organization.id,
         name=organization.name,
         fee_paid=organization.fee_paid,
@@ -874,7 +1259,7 @@ def build_organization_detail(
         bank_name=bank_name,
         bank_account_number=bank_account_number,
         payment_instructions=payment_instructions,
-        active_event=active_event_info(active_event),
+        active_event=active_info,
         active_event_delegate_user_id=active_delegate_user_id,
         active_event_delegate_user_ids=active_delegate_user_ids,
         contact=contact_info,
@@ -883,11 +1268,26 @@ def build_organization_detail(
     )
 
 
+def build_organization_reads(rows: Sequence[Row]) -> list[OrganizationRead]:
+    return [OrganizationRead.construct(**row._mapping) for row in rows]
+
+
+def build_admin_user_read(user: User) -> AdminUserRead:
+    return AdminUserRead.construct(
+        id=user.id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        created_at=user.created_at,
+        must_change_password=user.must_change_password,
+    )
+
+
 def build_event_read(event: VotingEvent) -> VotingEventRead:
     delegate_count = event_delegate_count(event)
     lock_state = delegate_lock_state(event)
     total_codes, available_codes, used_codes = event_access_code_counts(event)
-    return VotingEventRead(
+    return VotingEventRead.construct(
         id=event.id,
         title=event.title,
         description=event.description,
@@ -921,21 +1321,21 @@ def build_access_code_batch(
         used_by = getattr(code, "used_by_user", None)
         used_by_payload = None
         if used_by:
-            used_by_payload = VotingAccessCodeUserInfo(
+            used_by_payload = VotingAccessCodeUserInfo.construct(
                 id=used_by.id,
                 email=used_by.email,
                 first_name=used_by.first_name,
                 last_name=used_by.last_name,
             )
         items.append(
-            VotingAccessCodeInfo(
+            VotingAccessCodeInfo.construct(
                 code=code.code,
                 created_at=code.created_at,
                 used_at=code.used_at,
                 used_by=used_by_payload,
             )
         )
-    return VotingAccessCodeBatch(
+    return VotingAccessCodeBatch.construct(
         event_id=event.id,
         event_title=event.title,
         total=total,
@@ -945,32 +1345,50 @@ def build_access_code_batch(
     )
 
 
-def build_delegate_info(
-    organization: Organization, delegates: dict[int, list[EventDelegate]]
-) -> EventDelegateInfo:
-    entries: list[dict] = []
-    for delegate in delegates.get(organization.id, []):
-        user = delegate.user
-        if not user:
+def build_delegate_infos(rows: Sequence[Row]) -> list[EventDelegateInfo]:
+    infos: list[EventDelegateInfo] = []
+    current: EventDelegateInfo | None = None
+    for row in rows:
+        if row.organization_id is None:
             continue
-        entries.append(
+        if current is None or current.organization_id != row.organization_id:
+            current = EventDelegateInfo.construct(
+                organization_id=row.organization_id,
+                organization_name=row.organization_name,
+                delegates=[],
+            )
+            infos.append(current)
+        if row.user_id is None:
+            continue
+        current.delegates.append(
             {
-                "user_id": user.id,
-                "user_email": user.email,
-                "user_first_name": user.first_name,
-                "user_last_name": user.last_name,
+                "user_id": row.user_id,
+                "user_email": row.user_email,
+                "user_first_name": row.user_first_name,
+                "user_last_name": row.user_last_name,
             }
         )
-    return EventDelegateInfo(
-        organization_id=organization.id,
-        organization_name=organization.name,
-        delegates=entries,
-    )
+    return infos
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return etag in candidates or "*" in candidates
 
 
-@app.get("/", response_class=FileResponse)
-def login_page() -> FileResponse:
-    return FileResponse("app/static/login.html")
+def static_page_response(request: Request, filename: str) -> Response:
+    content, etag, headers = _STATIC_PAGE_CACHE[filename]
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def login_page(request: Request) -> Response:
+    return static_page_response(request, "login.html")
 
 
 def render_password_reset_request_page(
@@ -1266,49 +1684,49 @@ def submit_password_reset_confirm_form(
     )
 
 
-@app.get("/register", response_class=FileResponse)
-def register_page() -> FileResponse:
-    return FileResponse("app/static/register.html")
+@app.get("/register", response_class=HTMLResponse)
+async def register_page(request: Request) -> Response:
+    return static_page_response(request, "register.html")
 
 
-@app.get("/meghivas/{token}", response_class=FileResponse)
-def invitation_accept_page(token: str) -> FileResponse:  # pragma: no cover - file response
-    return FileResponse("app/static/invitation-accept.html")
+@app.get("/meghivas/{token}", response_class=HTMLResponse)
+async def invitation_accept_page(request: Request, token: str) -> Response:  # pragma: no cover - file response
+    return static_page_response(request, "invitation-accept.html")
 
 
-@app.get("/jelszo-frissites", response_class=FileResponse)
-def password_change_page() -> FileResponse:
-    return FileResponse("app/static/password-change.html")
+@app.get("/jelszo-frissites", response_class=HTMLResponse)
+async def password_change_page(request: Request) -> Response:
+    return static_page_response(request, "password-change.html")
 
 
-@app.get("/admin", response_class=FileResponse)
-def admin_overview_page() -> FileResponse:
-    return FileResponse("app/static/admin-overview.html")
+@app.get("/admin", response_class=HTMLResponse)
+async def admin_overview_page(request: Request) -> Response:
+    return static_page_response(request, "admin-overview.html")
 
 
-@app.get("/admin/szervezetek", response_class=FileResponse)
-def admin_organizations_page() -> FileResponse:
-    return FileResponse("app/static/admin-organizations.html")
+@app.get("/admin/szervezetek", response_class=HTMLResponse)
+async def admin_organizations_page(request: Request) -> Response:
+    return static_page_response(request, "admin-organizations.html")
 
 
-@app.get("/admin/jelentkezok", response_class=FileResponse)
-def admin_pending_page() -> FileResponse:
-    return FileResponse("app/static/admin-pending.html")
+@app.get("/admin/jelentkezok", response_class=HTMLResponse)
+async def admin_pending_page(request: Request) -> Response:
+    return static_page_response(request, "admin-pending.html")
 
 
-@app.get("/admin/esemenyek", response_class=FileResponse)
-def admin_events_page() -> FileResponse:
-    return FileResponse("app/static/admin-events.html")
+@app.get("/admin/esemenyek", response_class=HTMLResponse)
+async def admin_events_page(request: Request) -> Response:
+    return static_page_response(request, "admin-events.html")
 
 
-@app.get("/admin/felhasznalok", response_class=FileResponse)
-def admin_users_page() -> FileResponse:
-    return FileResponse("app/static/admin-users.html")
+@app.get("/admin/felhasznalok", response_class=HTMLResponse)
+async def admin_users_page(request: Request) -> Response:
+    return static_page_response(request, "admin-users.html")
 
 
-@app.get("/admin/beallitasok", response_class=FileResponse)
-def admin_settings_page() -> FileResponse:
-    return FileResponse("app/static/admin-settings.html")
+@app.get("/admin/beallitasok", response_class=HTMLResponse)
+async def admin_settings_page(request: Request) -> Response:
+    return static_page_response(request, "admin-settings.html")
 
 
 @app.get(
@@ -1318,12 +1736,14 @@ def admin_settings_page() -> FileResponse:
 )
 def get_bank_settings_endpoint(
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> BankSettingsResponse:
+    _: AdminUserDependency,
+) -> PydanticResponse:
     settings = get_site_settings(db)
-    return BankSettingsResponse(
-        bank_name=settings.bank_name,
-        bank_account_number=settings.bank_account_number,
+    return PydanticResponse(
+        BankSettingsResponse.construct(
+            bank_name=settings.bank_name,
+            bank_account_number=settings.bank_account_number,
+        )
     )
 
 
@@ -1335,38 +1755,40 @@ def get_bank_settings_endpoint(
 def update_bank_settings_endpoint(
     payload: BankSettingsUpdate,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> BankSettingsResponse:
+    _: AdminUserDependency,
+) -> PydanticResponse:
     settings = update_site_bank_settings(
         db,
         bank_name=payload.bank_name,
         bank_account_number=payload.bank_account_number,
     )
     db.commit()
-    return BankSettingsResponse(
-        bank_name=settings.bank_name,
-        bank_account_number=settings.bank_account_number,
+    return PydanticResponse(
+        BankSettingsResponse.construct(
+            bank_name=settings.bank_name,
+            bank_account_number=settings.bank_account_number,
+        )
     )
 
 
-@app.get("/szervezetek/{organization_id}/dij", response_class=FileResponse)
-def organization_unpaid_page(organization_id: int) -> FileResponse:
-    return FileResponse("app/static/member-unpaid.html")
+@app.get("/szervezetek/{organization_id}/dij", response_class=HTMLResponse)
+async def organization_unpaid_page(request: Request, organization_id: int) -> Response:
+    return static_page_response(request, "member-unpaid.html")
 
 
-@app.get("/szervezetek/{organization_id}/tagok", response_class=FileResponse)
-def organization_member_page(organization_id: int) -> FileResponse:
-    return FileResponse("app/static/member-home.html")
+@app.get("/szervezetek/{organization_id}/tagok", response_class=HTMLResponse)
+async def organization_member_page(request: Request, organization_id: int) -> Response:
+    return static_page_response(request, "member-home.html")
 
 
-@app.get("/szervezetek/{organization_id}/tagkezeles", response_class=FileResponse)
-def organization_member_manage_page(organization_id: int) -> FileResponse:
-    return FileResponse("app/static/member-members.html")
+@app.get("/szervezetek/{organization_id}/tagkezeles", response_class=HTMLResponse)
+async def organization_member_manage_page(request: Request, organization_id: int) -> Response:
+    return static_page_response(request, "member-members.html")
 
 
-@app.get("/szervezetek/{organization_id}/szavazas", response_class=FileResponse)
-def organization_voting_page(organization_id: int) -> FileResponse:
-    return FileResponse("app/static/member-voting.html")
+@app.get("/szervezetek/{organization_id}/szavazas", response_class=HTMLResponse)
+async def organization_voting_page(request: Request, organization_id: int) -> Response:
+    return static_page_response(request, "member-voting.html")
 
 
 @app.post(
@@ -1380,7 +1802,7 @@ def organization_voting_page(organization_id: int) -> FileResponse:
 )
 def create_voting_o2auth_session(
     organization_id: int,
-    user: Annotated[User, Depends(get_session_user)],
+    user: CurrentUserDependency,
     db: DatabaseDependency,
     launch: VotingO2AuthLaunchRequest | None = None,
 ) -> VotingO2AuthResponse:
@@ -1396,7 +1818,7 @@ def create_voting_o2auth_session(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="A szervezet tagsági díja rendezetlen, ezért nem nyitható meg a szavazási felület.",
         )
-    active_event = get_active_voting_event(db)
+    active_event = cached_active_voting_event(db)
     if active_event is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1456,7 +1878,7 @@ def create_voting_o2auth_session(
     )
     redirect = build_voting_redirect_url(token, view=requested_view)
     return VotingO2AuthResponse(
-        redirect=redirect, expires_in=_effective_o2auth_ttl()
+        redirect=redirect, expires_in=EFFECTIVE_O2AUTH_TTL_SECONDS
     )
 
 
@@ -1484,7 +1906,7 @@ def authenticate_for_voting(
     organization_id = organization.id if organization else None
     organization_fee_paid = organization.fee_paid if organization else None
 
-    active_event = get_active_voting_event(db)
+    active_event = cached_active_voting_event(db)
     is_delegate = False
     if active_event and organization_id is not None:
         delegate_map = delegates_for_event(db, event_id=active_event.id)
@@ -1548,9 +1970,9 @@ def authenticate_for_voting(
     )
 
 
-@app.get("/szervezetek/{organization_id}/penzugyek", response_class=FileResponse)
-def organization_financial_page(organization_id: int) -> FileResponse:
-    return FileResponse("app/static/member-financials.html")
+@app.get("/szervezetek/{organization_id}/penzugyek", response_class=HTMLResponse)
+async def organization_financial_page(request: Request, organization_id: int) -> Response:
+    return static_page_response(request, "member-financials.html")
 
 
 @app.get(
@@ -1558,22 +1980,23 @@ def organization_financial_page(organization_id: int) -> FileResponse:
     response_model=List[OrganizationRead],
     responses={404: {"model": ErrorResponse}},
 )
-def list_organizations(db: DatabaseDependency, q: str | None = None) -> List[OrganizationRead]:
-    organizations = search_organizations(db, q)
-    if not organizations:
+async def list_organizations(q: str | None = None) -> PydanticResponse:
+    rows = await read_all(search_organizations_statement(q))
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Nem található szervezet a megadott feltételekkel",
         )
-    return [OrganizationRead.from_orm(org) for org in organizations]
+    return PydanticResponse(build_organization_reads(rows))
 
 
 @app.get(
     "/api/organizations/lookup",
     response_model=List[OrganizationRead],
 )
-def lookup_organizations(db: DatabaseDependency, q: str | None = None) -> List[OrganizationRead]:
-    return [OrganizationRead.from_orm(org) for org in search_organizations(db, q)]
+async def lookup_organizations(q: str | None = None) -> PydanticResponse:
+    rows = await read_all(search_organizations_statement(q))
+    return PydanticResponse(build_organization_reads(rows))
 
 
 @app.post(
@@ -1581,31 +2004,40 @@ def lookup_organizations(db: DatabaseDependency, q: str | None = None) -> List[O
     response_model=RegistrationResponse,
     responses={400: {"model": ErrorResponse}},
 )
-def register(
+async def register(
     payload: RegistrationRequest,
     request: Request,
     db: DatabaseDependency,
 ) -> RegistrationResponse:
     if RECAPTCHA_ENABLED:
         try:
-            verify_recaptcha(
+            await verify_recaptcha(
                 payload.captcha_token or "",
                 secret=RECAPTCHA_SECRET_KEY,
+                client=request.app.state.http_client,
                 remote_ip=request.client.host if request.client else None,
             )
         except RegistrationError as exc:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
             ) from exc
-    try:
+    return await run_in_threadpool(_complete_registration, payload, request, db)
+
+
+def _complete_registration(
+    payload: RegistrationRequest, request: Request, db: Session
+) -> RegistrationResponse:
+    canonical_email = payload.email.lower()
+    with registration_transaction(db, status_code=status.HTTP_400_BAD_REQUEST):
         token = register_user(
             db,
             email=payload.email,
+            canonical_email=canonical_email,
             first_name=payload.first_name,
             last_name=payload.last_name,
             password=payload.password,
             organization_id=payload.organization_id,
-            is_admin=payload.email.lower() in ADMIN_EMAILS,
+            is_admin=canonical_email in ADMIN_EMAILS,
         )
         link = queue_verification_email(
             token,
@@ -1614,25 +2046,24 @@ def register(
             sender_email=BREVO_SENDER_EMAIL or None,
             sender_name=BREVO_SENDER_NAME,
         )
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     request.app.state.email_queue.append(
         {
             "email": payload.email,
             "token": token.token,
             "verification_link": link,
-            "sent_via": "brevo" if BREVO_API_KEY and BREVO_SENDER_EMAIL else "noop",
+            "sent_via": EMAIL_DELIVERY_METHOD,
         }
     )
     message = "Sikeres regisztráció. Kérjük, erősítsd meg az e-mail címedet."
     return RegistrationResponse(message=message)
 
 
-@app.get("/api/debug/email-queue")
-def email_queue(request: Request) -> list[dict[str, str]]:
-    return list(getattr(request.app.state, "email_queue", []))
+@app.get("/api/debug/email-queue", responses={401: {"model": ErrorResponse}})
+def email_queue(
+    request: Request,
+    _: AdminUserDependency,
+) -> ORJSONResponse:
+    return ORJSONResponse(list(getattr(request.app.state, "email_queue", ())))
 
 
 @app.get(
@@ -1641,12 +2072,8 @@ def email_queue(request: Request) -> list[dict[str, str]]:
     responses={400: {"model": ErrorResponse}},
 )
 def verify(token: str, db: DatabaseDependency) -> VerificationResponse:
-    try:
+    with registration_transaction(db, status_code=status.HTTP_400_BAD_REQUEST):
         user = verify_email(db, token)
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     if user.admin_decision == ApprovalDecision.pending:
         message = "Az e-mail cím igazolva. A fiók adminisztrátori jóváhagyásra vár."
@@ -1660,22 +2087,59 @@ def verify(token: str, db: DatabaseDependency) -> VerificationResponse:
     response_model=LoginResponse,
     responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}},
 )
-def login(request: LoginRequest, db: DatabaseDependency) -> LoginResponse:
+async def login(request: LoginRequest, db: DatabaseDependency) -> LoginResponse:
+    # Key derivation runs on the dedicated hashing pool between two short
+    # database round trips, so neither a connection nor a request thread is
+    # held while it computes.
+    rows = await read_all(login_credentials_statement(request.email))
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=INVALID_LOGIN_MESSAGE
+        )
+    credentials = rows[0]
+    check = await verify_password_async(
+        request.password, credentials.password_salt, credentials.password_hash
+    )
+    if not check.is_valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=INVALID_LOGIN_MESSAGE
+        )
+    rehashed = (
+        await hash_password_async(request.password) if check.needs_rehash else None
+    )
     try:
-        user = authenticate_user(db, email=request.email, password=request.password)
+        return await run_in_threadpool(
+            partial(
+                _complete_login,
+                db,
+                user_id=credentials.id,
+                verified_hash=credentials.password_hash,
+                rehashed=rehashed,
+            )
+        )
     except AuthenticationError as exc:
-        detail = str(exc)
-        forbidden_phrases = [
-            "jóváhagyásra vár",
-            "el lett utasítva",
-            "erősítsd meg",
-        ]
         status_code = (
             status.HTTP_403_FORBIDDEN
-            if any(phrase in detail for phrase in forbidden_phrases)
+            if isinstance(exc, AccountNotActiveError)
             else status.HTTP_401_UNAUTHORIZED
         )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
+        raise HTTPException(status_code=status_code, detail=str(exc)) from exc
+
+
+def _complete_login(
+    session: Session,
+    *,
+    user_id: int,
+    verified_hash: str,
+    rehashed: tuple[str, str] | None,
+) -> LoginResponse:
+    user = session.get(User, user_id)
+    # The password may have changed while it was being verified.
+    if user is None or user.password_hash != verified_hash:
+        raise AuthenticationError(INVALID_LOGIN_MESSAGE)
+    ensure_user_can_log_in(user)
+    if rehashed is not None:
+        user.password_salt, user.password_hash = rehashed
     organization_id: int | None = user.organization.id if user.organization else None
     organization_fee_paid: bool | None = (
         user.organization.fee_paid if user.organization else None
@@ -1690,8 +2154,8 @@ def login(request: LoginRequest, db: DatabaseDependency) -> LoginResponse:
         )
     else:
         redirect = USER_REDIRECT_PATH
-    session_token = create_session_token(db, user=user)
-    db.commit()
+    session_token = create_session_token(session, user=user)
+    session.commit()
     return LoginResponse(
         message="Sikeres bejelentkezés",
         redirect=redirect,
@@ -1829,7 +2293,7 @@ def confirm_password_reset(
 def change_password(
     payload: PasswordChangeRequest,
     db: DatabaseDependency,
-    user: Annotated[User, Depends(get_session_user)],
+    user: CurrentUserDependency,
 ) -> PasswordChangeResponse:
     try:
         session_token = change_user_password(
@@ -1853,21 +2317,28 @@ def change_password(
     )
 
 
+PUBLIC_CONFIG_CACHE_CONTROL = "public, max-age=3600"
+_PUBLIC_CONFIG = (
+    PublicConfigResponse(
+        recaptcha_site_key=RECAPTCHA_SITE_KEY,
+        captcha_provider="google_recaptcha",
+    )
+    if RECAPTCHA_ENABLED
+    else PublicConfigResponse(recaptcha_site_key=None, captcha_provider=None)
+)
+
+
 @app.get("/api/public/config", response_model=PublicConfigResponse)
-def public_config() -> PublicConfigResponse:
-    if RECAPTCHA_ENABLED:
-        return PublicConfigResponse(
-            recaptcha_site_key=RECAPTCHA_SITE_KEY,
-            captcha_provider="google_recaptcha",
-        )
-    return PublicConfigResponse(recaptcha_site_key=None, captcha_provider=None)
+async def public_config(response: Response) -> PublicConfigResponse:
+    response.headers["Cache-Control"] = PUBLIC_CONFIG_CACHE_CONTROL
+    return _PUBLIC_CONFIG
 
 
 @app.get("/api/me", response_model=SessionUser, responses={401: {"model": ErrorResponse}})
 def current_user(
-    user: Annotated[User, Depends(get_session_user)], db: DatabaseDependency
+    user: CurrentUserDependency, db: DatabaseDependency
 ) -> SessionUser:
-    active_event = get_active_voting_event(db)
+    active_event = cached_active_voting_event(db)
     site_settings = get_site_settings(db)
     return SessionUser(
         id=user.id,
@@ -1887,23 +2358,22 @@ def current_user(
     response_model=List[PendingUser],
     responses={401: {"model": ErrorResponse}},
 )
-def admin_pending(
-    db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> List[PendingUser]:
-    users = list(pending_registrations(db))
-    return [
-        PendingUser(
-            id=user.id,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            organization=user.organization.name if user.organization else "Ismeretlen",
-            is_email_verified=user.is_email_verified,
-            created_at=user.created_at,
-        )
-        for user in users
-    ]
+async def admin_pending(_: AdminUserDependency) -> PydanticResponse:
+    rows = await read_all(pending_registrations_statement())
+    return PydanticResponse(
+        [
+            PendingUser.construct(
+                id=row.id,
+                email=row.email,
+                first_name=row.first_name,
+                last_name=row.last_name,
+                organization=row.organization_name or "Ismeretlen",
+                is_email_verified=row.is_email_verified,
+                registered_at=row.created_at,
+            )
+            for row in rows
+        ]
+    )
 
 
 @app.post(
@@ -1915,19 +2385,17 @@ def admin_decide(
     user_id: int,
     request: AdminDecisionRequest,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> AdminDecisionResponse:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db, status_code=status.HTTP_404_NOT_FOUND):
         user = decide_registration(db, user_id=user_id, approve=request.approve)
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     if request.approve:
         message = "A felhasználó jóvá lett hagyva és megerősítettnek tekintjük az e-mail címét."
     else:
         message = "A felhasználó elutasítva."
-    return AdminDecisionResponse(message=message, decision=user.admin_decision)
+    return PydanticResponse(
+        AdminDecisionResponse(message=message, decision=user.admin_decision)
+    )
 
 
 @app.post(
@@ -1939,29 +2407,41 @@ def admin_decide(
 def create_organization_endpoint(
     payload: OrganizationCreateRequest,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> OrganizationDetail:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db, status_code=status.HTTP_400_BAD_REQUEST):
         organization = create_organization(
             db,
             name=payload.name,
         )
         db.flush()
-        active_event = get_active_voting_event(db)
+        active_event = cached_active_voting_event(db)
         site_settings = get_site_settings(db)
         detail = build_organization_detail(
             organization, active_event=active_event, settings=site_settings
         )
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
-        ) from exc
-    db.commit()
-    return detail
+    return PydanticResponse(detail, status_code=status.HTTP_201_CREATED)
+
+
+class CachedStaticFiles(StaticFiles):
+    # Assets only change on deploy, so path resolution and the stat() result
+    # are memoized instead of hitting the filesystem for every request.
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_lookup_path = lru_cache(maxsize=STATIC_LOOKUP_CACHE_SIZE)(
+            super().lookup_path
+        )
 
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        return self._cached_lookup_path(path)
 
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", STATIC_PAGE_CACHE_CONTROL)
+        return response
+
+
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIRECTORY), name="static")
 
 
 @app.get(
@@ -1969,48 +2449,118 @@ app.mount("/static", StaticFiles(directory="app/static"), name="static")
     response_model=List[OrganizationDetail],
     responses={401: {"model": ErrorResponse}},
 )
-def admin_organizations(
+async def admin_organizations(
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> List[OrganizationDetail]:
-    organizations = organizations_with_members(db)
-    active_event = get_active_voting_event(db)
-    site_settings = get_site_settings(db)
-    return [
-        build_organization_detail(
-            org, active_event=active_event, settings=site_settings
+    _: AdminUserDependency,
+) -> Response:
+    # Event changes invalidate the cache on commit, so the key does not need
+    # the active event id.
+    cache_key = "organizations"
+    cached_body = organization_list_cache.get(cache_key, None)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    generation = organization_list_cache.generation
+    body = await run_in_threadpool(_organization_details_body, db)
+    organization_list_cache.set(body, cache_key, generation=generation)
+    return Response(content=body, media_type="application/json")
+
+
+def _organization_details_body(session: Session) -> bytes:
+    organizations = organizations_with_members(session)
+    active_event, site_settings = _active_event_with_settings(session)
+    details = build_organization_details(
+        organizations, active_event=active_event, settings=site_settings
+    )
+    return PydanticResponse(details).body
+
+
+@app.get(
+    "/api/admin/organizations.ndjson",
+    response_class=StreamingResponse,
+    responses={401: {"model": ErrorResponse}},
+)
+async def admin_organizations_ndjson(_: AdminUserDependency) -> StreamingResponse:
+    return StreamingResponse(
+        _organization_detail_lines(), media_type="application/x-ndjson"
+    )
+
+
+def _organization_detail_lines() -> Iterator[bytes]:
+    # The request session is closed before the body streams, so the generator
+    # owns its own session for the whole iteration.
+    with SessionLocal() as session:
+        active_event, site_settings = _active_event_with_settings(session)
+        active_info = active_event_info(active_event)
+        for organization in iter_organizations_with_members(session):
+            detail = _build_organization_detail(
+                organization,
+                active_event=active_event,
+                active_info=active_info,
+                events=None,
+                settings=site_settings,
+            )
+            yield orjson.dumps(
+                detail.dict(by_alias=True), option=orjson.OPT_APPEND_NEWLINE
+            )
+
+
+@app.get(
+    "/api/organizations/{organization_id}/members.ndjson",
+    response_class=StreamingResponse,
+    responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
+)
+async def organization_members_ndjson(
+    organization_id: int,
+    user: CurrentUserDependency,
+) -> StreamingResponse:
+    ensure_organization_membership(user, organization_id)
+    rows = await read_all(
+        select(Organization.fee_paid).where(Organization.id == organization_id)
+    )
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Nem található szervezet"
         )
-        for org in organizations
-    ]
+    return StreamingResponse(
+        _organization_member_lines(organization_id, fee_paid=rows[0].fee_paid),
+        media_type="application/x-ndjson",
+    )
+
+
+def _organization_member_lines(
+    organization_id: int, *, fee_paid: bool
+) -> Iterator[bytes]:
+    with SessionLocal() as session:
+        for member in iter_organization_members(session, organization_id):
+            payload = build_member_payload(member, fee_paid=fee_paid)
+            yield orjson.dumps(
+                payload.dict(by_alias=True), option=orjson.OPT_APPEND_NEWLINE
+            )
+
+
+def _active_event_with_settings(
+    session: Session,
+) -> tuple[VotingEvent | None, SiteSettings]:
+    return get_active_voting_event(session), get_site_settings(session)
 
 
 @app.post(
     "/api/admin/organizations/{organization_id}/fee",
-    response_model=OrganizationDetail,
+    response_model=OrganizationUpdateAck,
     responses={401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
 def update_organization_fee(
     organization_id: int,
     payload: OrganizationFeeUpdate,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> OrganizationDetail:
-    try:
-        organization = set_organization_fee_status(
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db, status_code=status.HTTP_404_NOT_FOUND):
+        set_organization_fee_status(
             db, organization_id=organization_id, fee_paid=payload.fee_paid
         )
-        db.flush()
-        active_event = get_active_voting_event(db)
-        site_settings = get_site_settings(db)
-        detail = build_organization_detail(
-            organization, active_event=active_event, settings=site_settings
-        )
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-
-    db.commit()
-    return detail
+    return PydanticResponse(OrganizationUpdateAck(id=organization_id))
 
 
 @app.post(
@@ -2018,11 +2568,11 @@ def update_organization_fee(
     response_model=OrganizationDetail,
     responses={401: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
-def update_organization_billing(
+async def update_organization_billing(
     organization_id: int,
     payload: OrganizationBillingUpdate,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
+    _: AdminUserDependency,
 ) -> OrganizationDetail:
     raise HTTPException(
         status_code=status.HTTP_410_GONE,
@@ -2045,8 +2595,8 @@ def create_contact_invitation_endpoint(
     payload: InvitationCreateRequest,
     request: Request,
     db: DatabaseDependency,
-    admin: Annotated[User, Depends(require_admin)],
-) -> OrganizationDetail:
+    admin: AdminUserDependency,
+) -> PydanticResponse:
     invitation: OrganizationInvitation | None = None
     promoted_user: User | None = None
     if payload.role != InvitationRole.contact:
@@ -2054,7 +2604,7 @@ def create_contact_invitation_endpoint(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A kapcsolattartó meghívásához a role mezőnek 'contact'-nak kell lennie.",
         )
-    try:
+    with registration_transaction(db):
         invitation, promoted_user = create_contact_invitation(
             db,
             organization_id=organization_id,
@@ -2079,17 +2629,6 @@ def create_contact_invitation_endpoint(
                 sender_email=BREVO_SENDER_EMAIL or None,
                 sender_name=BREVO_SENDER_NAME,
             )
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        if "nem található" in lowered:
-            status_code = status.HTTP_404_NOT_FOUND
-        else:
-            status_code = status.HTTP_400_BAD_REQUEST
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
     if invitation is not None and link is not None:
         request.app.state.email_queue.append(
             {
@@ -2098,9 +2637,7 @@ def create_contact_invitation_endpoint(
                 "token": invitation.token,
                 "role": invitation.role.value,
                 "link": link,
-                "sent_via": "brevo"
-                if BREVO_API_KEY and BREVO_SENDER_EMAIL
-                else "noop",
+                "sent_via": EMAIL_DELIVERY_METHOD,
             }
         )
     elif promoted_user is not None:
@@ -2114,7 +2651,7 @@ def create_contact_invitation_endpoint(
                 "sent_via": "existing-user",
             }
         )
-    return detail
+    return PydanticResponse(detail)
 
 
 @app.get(
@@ -2158,7 +2695,7 @@ def accept_invitation_endpoint(
     payload: InvitationAcceptRequest,
     db: DatabaseDependency,
 ) -> SimpleMessageResponse:
-    try:
+    with registration_transaction(db):
         accept_invitation(
             db,
             token=token,
@@ -2166,16 +2703,6 @@ def accept_invitation_endpoint(
             last_name=payload.last_name,
             password=payload.password,
         )
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        if "nem található" in lowered or "érvénytelen" in lowered:
-            status_code = status.HTTP_404_NOT_FOUND
-        else:
-            status_code = status.HTTP_400_BAD_REQUEST
-        raise HTTPException(status_code=status_code, detail=detail) from exc
 
     return SimpleMessageResponse(
         message="Sikeres meghívó elfogadás. Most már bejelentkezhetsz az új jelszóval."
@@ -2189,10 +2716,10 @@ def accept_invitation_endpoint(
 )
 def list_voting_events_endpoint(
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> List[VotingEventRead]:
+    _: AdminUserDependency,
+) -> PydanticResponse:
     events = list_voting_events(db)
-    return [build_event_read(event) for event in events]
+    return PydanticResponse([build_event_read(event) for event in events])
 
 
 @app.post(
@@ -2203,10 +2730,11 @@ def list_voting_events_endpoint(
 )
 def create_voting_event_endpoint(
     payload: VotingEventCreateRequest,
+    background_tasks: BackgroundTasks,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> VotingEventRead:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db, status_code=status.HTTP_400_BAD_REQUEST):
         event = create_voting_event(
             db,
             title=payload.title,
@@ -2216,15 +2744,9 @@ def create_voting_event_endpoint(
             delegate_limit=payload.delegate_limit,
             activate=payload.activate,
         )
-        db.flush()
-        db.refresh(event, attribute_names=["delegates"])
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-
-    db.commit()
-    _sync_active_event(db)
-    return build_event_read(event)
+        event_read = build_event_read(event)
+    background_tasks.add_task(_sync_active_event_in_background)
+    return PydanticResponse(event_read, status_code=status.HTTP_201_CREATED)
 
 
 @app.patch(
@@ -2239,10 +2761,11 @@ def create_voting_event_endpoint(
 def update_voting_event_endpoint(
     event_id: int,
     payload: VotingEventUpdateRequest,
+    background_tasks: BackgroundTasks,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> VotingEventRead:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db):
         event = update_voting_event(
             db,
             event_id=event_id,
@@ -2254,20 +2777,8 @@ def update_voting_event_endpoint(
         )
         db.flush()
         db.refresh(event, attribute_names=["delegates"])
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if "nem található" in lowered
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
-    _sync_active_event(db)
-    return build_event_read(event)
+    background_tasks.add_task(_sync_active_event_in_background)
+    return PydanticResponse(build_event_read(event))
 
 
 @app.post(
@@ -2277,20 +2788,15 @@ def update_voting_event_endpoint(
 )
 def activate_voting_event_endpoint(
     event_id: int,
+    background_tasks: BackgroundTasks,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> VotingEventRead:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db, status_code=status.HTTP_404_NOT_FOUND):
         event = set_active_voting_event(db, event_id)
-        db.flush()
-        db.refresh(event, attribute_names=["delegates"])
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-
-    db.commit()
-    _sync_active_event(db)
-    return build_event_read(event)
+        event_read = build_event_read(event)
+    background_tasks.add_task(_sync_active_event_in_background)
+    return PydanticResponse(event_read)
 
 
 @app.post(
@@ -2305,29 +2811,17 @@ def activate_voting_event_endpoint(
 def update_event_accessibility(
     event_id: int,
     payload: VotingEventAccessUpdate,
+    background_tasks: BackgroundTasks,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> VotingEventRead:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db):
         event = set_voting_event_accessibility(
             db, event_id=event_id, is_voting_enabled=payload.is_voting_enabled
         )
-        db.flush()
-        db.refresh(event, attribute_names=["delegates"])
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if "nem található" in lowered
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
-    _sync_active_event(db)
-    return build_event_read(event)
+        event_read = build_event_read(event)
+    background_tasks.add_task(_sync_active_event_in_background)
+    return PydanticResponse(event_read)
 
 
 @app.post(
@@ -2342,27 +2836,15 @@ def update_event_accessibility(
 def update_delegate_lock_state(
     event_id: int,
     payload: DelegateLockUpdateRequest,
+    background_tasks: BackgroundTasks,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> VotingEventRead:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db):
         event = set_delegate_lock_override(db, event_id=event_id, mode=payload.mode)
-        db.flush()
-        db.refresh(event, attribute_names=["delegates"])
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if "nem található" in lowered
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
-    _sync_active_event(db)
-    return build_event_read(event)
+        event_read = build_event_read(event)
+    background_tasks.add_task(_sync_active_event_in_background)
+    return PydanticResponse(event_read)
 
 
 @app.get(
@@ -2373,8 +2855,8 @@ def update_delegate_lock_state(
 def list_event_access_codes(
     event_id: int,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> VotingAccessCodeBatch:
+    _: AdminUserDependency,
+) -> PydanticResponse:
     event = db.get(VotingEvent, event_id)
     if event is None:
         raise HTTPException(
@@ -2382,7 +2864,9 @@ def list_event_access_codes(
             detail="Nem található szavazási esemény",
         )
     codes, total, available, used = voting_access_code_summary(db, event_id)
-    return build_access_code_batch(event, codes, total, available, used)
+    return PydanticResponse(
+        build_access_code_batch(event, codes, total, available, used)
+    )
 
 
 @app.post(
@@ -2398,8 +2882,8 @@ def generate_event_access_codes(
     event_id: int,
     payload: VotingAccessCodeGenerateRequest,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> VotingAccessCodeBatch:
+    _: AdminUserDependency,
+) -> PydanticResponse:
     event = db.get(VotingEvent, event_id)
     if event is None:
         raise HTTPException(
@@ -2419,17 +2903,16 @@ def generate_event_access_codes(
         ) from exc
     except RegistrationError as exc:
         db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        status_code = (
-            status.HTTP_404_NOT_FOUND if "nem található" in lowered else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
+        raise HTTPException(
+            status_code=registration_error_status(exc), detail=str(exc)
+        ) from exc
 
     db.commit()
     refreshed = db.get(VotingEvent, event_id)
     codes, total, available, used = voting_access_code_summary(db, event_id)
-    return build_access_code_batch(refreshed or event, codes, total, available, used)
+    return PydanticResponse(
+        build_access_code_batch(refreshed or event, codes, total, available, used)
+    )
 
 
 @app.get(
@@ -2440,7 +2923,7 @@ def generate_event_access_codes(
 def download_event_access_codes_pdf(
     event_id: int,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
+    _: AdminUserDependency,
 ) -> Response:
     event = db.get(VotingEvent, event_id)
     if event is None:
@@ -2465,15 +2948,21 @@ def download_event_access_codes_pdf(
 def list_event_delegates(
     event_id: int,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> List[EventDelegateInfo]:
-    event = db.get(VotingEvent, event_id)
-    if event is None:
+    _: AdminUserDependency,
+) -> Response:
+    cache_key = ("event-delegates", event_id)
+    cached_body = organization_list_cache.get(cache_key, None)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    generation = organization_list_cache.generation
+    rows = event_delegate_rows(db, event_id=event_id)
+    if not rows:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Nem található szavazási esemény")
 
-    delegate_map = delegates_for_event(db, event_id=event_id)
-    organizations = organizations_with_members(db)
-    return [build_delegate_info(org, delegate_map) for org in organizations]
+    response = PydanticResponse(build_delegate_infos(rows))
+    organization_list_cache.set(response.body, cache_key, generation=generation)
+    return response
 
 
 @app.post(
@@ -2490,29 +2979,18 @@ def update_event_delegates(
     organization_id: int,
     payload: EventDelegateAssignmentRequest,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> SimpleMessageResponse:
-    try:
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    with registration_transaction(db):
         set_event_delegates_for_organization(
             db,
             event_id=event_id,
             organization_id=organization_id,
             user_ids=payload.user_ids,
         )
-        db.flush()
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if "nem található" in lowered
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
-    return SimpleMessageResponse(message="A szervezet delegáltjai frissítve.")
+    return PydanticResponse(
+        SimpleMessageResponse(message="A szervezet delegáltjai frissítve.")
+    )
 
 
 @app.delete(
@@ -2528,20 +3006,10 @@ def update_event_delegates(
 def delete_event_endpoint(
     event_id: int,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
+    _: AdminUserDependency,
 ) -> Response:
-    try:
+    with registration_transaction(db):
         delete_voting_event(db, event_id=event_id)
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        status_code = (
-            status.HTTP_400_BAD_REQUEST
-            if "nem törölhető" in detail.lower()
-            else status.HTTP_404_NOT_FOUND
-        )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -2552,12 +3020,13 @@ def delete_event_endpoint(
     responses={401: {"model": ErrorResponse}},
 )
 def reset_events_endpoint(
+    background_tasks: BackgroundTasks,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> SimpleMessageResponse:
+    _: AdminUserDependency,
+) -> PydanticResponse:
     removed = reset_voting_events(db)
     db.commit()
-    _sync_voting_service(None)
+    background_tasks.add_task(_sync_voting_service, None)
 
     if removed == 0:
         message = "Nem volt törölhető esemény."
@@ -2566,7 +3035,7 @@ def reset_events_endpoint(
     else:
         message = f"{removed} esemény és a kapcsolódó delegáltak törölve."
 
-    return SimpleMessageResponse(message=message)
+    return PydanticResponse(SimpleMessageResponse(message=message))
 
 
 @app.get(
@@ -2576,9 +3045,11 @@ def reset_events_endpoint(
 )
 def list_admin_accounts(
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
-) -> List[AdminUserRead]:
-    return list_admin_users(db)
+    _: AdminUserDependency,
+) -> PydanticResponse:
+    return PydanticResponse(
+        [build_admin_user_read(user) for user in list_admin_users(db)]
+    )
 
 
 @app.post(
@@ -2594,9 +3065,9 @@ def list_admin_accounts(
 def create_admin_account_endpoint(
     payload: AdminUserCreateRequest,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
+    _: AdminUserDependency,
 ) -> AdminUserCreateResponse:
-    try:
+    with registration_transaction(db, status_code=status.HTTP_400_BAD_REQUEST):
         admin_user, temporary_password = create_admin_account(
             db,
             email=payload.email,
@@ -2611,10 +3082,6 @@ def create_admin_account_endpoint(
             sender_email=BREVO_SENDER_EMAIL or None,
             sender_name=BREVO_SENDER_NAME or None,
         )
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     db.refresh(admin_user)
     message = (
@@ -2638,15 +3105,15 @@ def create_admin_account_endpoint(
 def resend_admin_invitation(
     admin_id: int,
     db: DatabaseDependency,
-    current_admin: Annotated[User, Depends(require_admin)],
-) -> SimpleMessageResponse:
+    current_admin: AdminUserDependency,
+) -> PydanticResponse:
     if admin_id == current_admin.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="A saját adminisztrátori fiókhoz nem küldhetsz új meghívót.",
         )
 
-    try:
+    with registration_transaction(db):
         admin_user, temporary_password = reset_admin_temporary_password(
             db, user_id=admin_id
         )
@@ -2658,19 +3125,9 @@ def resend_admin_invitation(
             sender_email=BREVO_SENDER_EMAIL or None,
             sender_name=BREVO_SENDER_NAME or None,
         )
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        status_code_value = (
-            status.HTTP_404_NOT_FOUND
-            if "nem található" in detail.lower()
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(status_code=status_code_value, detail=detail) from exc
 
     message = "Új meghívó e-mail elküldve az adminisztrátornak."
-    return SimpleMessageResponse(message=message)
+    return PydanticResponse(SimpleMessageResponse(message=message))
 
 
 @app.delete(
@@ -2687,22 +3144,12 @@ def resend_admin_invitation(
 def delete_admin(
     admin_id: int,
     db: DatabaseDependency,
-    current_admin: Annotated[User, Depends(require_admin)],
+    current_admin: AdminUserDependency,
 ) -> Response:
-    try:
+    with registration_transaction(db):
         delete_admin_account(
             db, admin_id=admin_id, acting_admin_id=current_admin.id
         )
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        status_code_value = (
-            status.HTTP_404_NOT_FOUND
-            if "nem található" in detail.lower()
-            else status.HTTP_400_BAD_REQUEST
-        )
-        raise HTTPException(status_code=status_code_value, detail=detail) from exc
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -2716,20 +3163,10 @@ def delete_admin(
 def delete_user(
     user_id: int,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
+    _: AdminUserDependency,
 ) -> Response:
-    try:
+    with registration_transaction(db):
         delete_user_account(db, user_id=user_id)
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        status_code = (
-            status.HTTP_400_BAD_REQUEST
-            if "nem lehet törölni" in detail.lower()
-            else status.HTTP_404_NOT_FOUND
-        )
-        raise HTTPException(status_code=status_code, detail=detail) from exc
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -2747,47 +3184,83 @@ def delete_user(
 def delete_organization_endpoint(
     organization_id: int,
     db: DatabaseDependency,
-    _: Annotated[User, Depends(require_admin)],
+    _: AdminUserDependency,
 ) -> Response:
-    try:
+    with registration_transaction(db):
         delete_organization(db, organization_id=organization_id)
-        db.commit()
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        if "nem törölhető" in lowered:
-            status_code = status.HTTP_400_BAD_REQUEST
-        elif "nem található" in lowered:
-            status_code = status.HTTP_404_NOT_FOUND
-        else:
-            status_code = status.HTTP_400_BAD_REQUEST
-        raise HTTPException(status_code=status_code, detail=detail) from exc
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @app.get(
     "/api/organizations/{organization_id}/detail",
-    response_model=OrganizationDetail,
+    response_model=Union[OrganizationDetail, OrganizationSummary],
     responses={401: {"model": ErrorResponse}, 403: {"model": ErrorResponse}, 404: {"model": ErrorResponse}},
 )
-def organization_detail_endpoint(
+async def organization_detail_endpoint(
     organization_id: int,
+    request: Request,
     db: DatabaseDependency,
-    user: Annotated[User, Depends(get_session_user)],
-) -> OrganizationDetail:
+    user: CurrentUserDependency,
+    summary: bool = False,
+) -> Response:
     ensure_organization_membership(user, organization_id)
-    try:
-        organization = organization_with_members(db, organization_id)
-    except RegistrationError as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-    active_event = get_active_voting_event(db)
-    events = upcoming_voting_events(db)
-    site_settings = get_site_settings(db)
-    return build_organization_detail(
-        organization, active_event=active_event, events=events, settings=site_settings
+    if summary:
+        cache_key = ("organization-summary", organization_id)
+        build_body = _organization_summary_body
+    else:
+        cache_key = ("organization-detail", organization_id)
+        build_body = _organization_detail_body
+    cached = organization_list_cache.get(cache_key, None)
+    if cached is None:
+        generation = organization_list_cache.generation
+        try:
+            body = await run_in_threadpool(
+                build_body, db, organization_id=organization_id
+            )
+        except RegistrationError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+            ) from exc
+        cached = (body, f'"{hashlib.blake2s(body).hexdigest()}"')
+        organization_list_cache.set(cached, cache_key, generation=generation)
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _organization_detail_body(session: Session, *, organization_id: int) -> bytes:
+    organization = organization_with_members(session, organization_id)
+    detail = build_organization_detail(
+        organization,
+        active_event=get_active_voting_event(session),
+        events=upcoming_voting_events(session),
+        settings=get_site_settings(session),
     )
+    return PydanticResponse(detail).body
+
+
+def _organization_summary_body(session: Session, *, organization_id: int) -> bytes:
+    # Header-only view: the member count comes from COUNT(*) and none of the
+    # member, delegate, invitation or event collections are loaded.
+    organization = session.get(Organization, organization_id)
+    if organization is None:
+        raise NotFoundError("Nem található szervezet")
+    bank_name, bank_account_number, payment_instructions = organization_bank_details(
+        organization, settings=get_site_settings(session)
+    )
+    summary = OrganizationSummary.construct(
+        id=organization.id,
+        name=organization.name,
+        fee_paid=organization.fee_paid,
+        member_count=organization_member_count(session, organization_id),
+        bank_name=bank_name,
+        bank_account_number=bank_account_number,
+        payment_instructions=payment_instructions,
+    )
+    return PydanticResponse(summary).body
 
 
 @app.post(
@@ -2805,8 +3278,8 @@ def create_member_invitation_endpoint(
     payload: InvitationCreateRequest,
     request: Request,
     db: DatabaseDependency,
-    user: Annotated[User, Depends(get_session_user)],
-) -> OrganizationDetail:
+    user: CurrentUserDependency,
+) -> PydanticResponse:
     ensure_organization_membership(user, organization_id)
     role = payload.role
     if role == InvitationRole.contact and not user.is_admin:
@@ -2822,7 +3295,7 @@ def create_member_invitation_endpoint(
 
     invitation: OrganizationInvitation | None = None
     promoted_user: User | None = None
-    try:
+    with registration_transaction(db):
         if role == InvitationRole.contact:
             invitation, promoted_user = create_contact_invitation(
                 db,
@@ -2861,17 +3334,6 @@ def create_member_invitation_endpoint(
                 sender_email=BREVO_SENDER_EMAIL or None,
                 sender_name=BREVO_SENDER_NAME,
             )
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        if "nem található" in lowered:
-            status_code = status.HTTP_404_NOT_FOUND
-        else:
-            status_code = status.HTTP_400_BAD_REQUEST
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
     if invitation is not None and link is not None:
         request.app.state.email_queue.append(
             {
@@ -2880,9 +3342,7 @@ def create_member_invitation_endpoint(
                 "token": invitation.token,
                 "role": invitation.role.value,
                 "link": link,
-                "sent_via": "brevo"
-                if BREVO_API_KEY and BREVO_SENDER_EMAIL
-                else "noop",
+                "sent_via": EMAIL_DELIVERY_METHOD,
             }
         )
     elif promoted_user is not None:
@@ -2896,7 +3356,7 @@ def create_member_invitation_endpoint(
                 "sent_via": "existing-user",
             }
         )
-    return detail
+    return PydanticResponse(detail)
 
 
 @app.delete(
@@ -2913,8 +3373,8 @@ def remove_organization_member_endpoint(
     organization_id: int,
     member_id: int,
     db: DatabaseDependency,
-    user: Annotated[User, Depends(get_session_user)],
-) -> OrganizationDetail:
+    user: CurrentUserDependency,
+) -> PydanticResponse:
     ensure_organization_membership(user, organization_id)
     if not (user.is_admin or user.is_organization_contact):
         raise HTTPException(
@@ -2922,7 +3382,7 @@ def remove_organization_member_endpoint(
             detail="Csak a kapcsolattartó távolíthat el tagot a szervezetből.",
         )
 
-    try:
+    with registration_transaction(db):
         remove_member_from_organization(
             db,
             organization_id=organization_id,
@@ -2939,18 +3399,7 @@ def remove_organization_member_endpoint(
             events=events,
             settings=site_settings,
         )
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        if "nem található" in lowered:
-            status_code = status.HTTP_404_NOT_FOUND
-        else:
-            status_code = status.HTTP_400_BAD_REQUEST
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
-    return detail
+    return PydanticResponse(detail)
 
 
 @app.post(
@@ -2968,8 +3417,8 @@ def set_organization_event_delegates(
     event_id: int,
     payload: EventDelegateAssignmentRequest,
     db: DatabaseDependency,
-    user: Annotated[User, Depends(get_session_user)],
-) -> OrganizationDetail:
+    user: CurrentUserDependency,
+) -> PydanticResponse:
     ensure_organization_membership(user, organization_id)
     if not (user.is_admin or user.is_organization_contact):
         raise HTTPException(
@@ -2977,7 +3426,7 @@ def set_organization_event_delegates(
             detail="Csak a szervezet kapcsolattartója jelölhet ki delegáltakat.",
         )
 
-    try:
+    with registration_transaction(db):
         set_event_delegates_for_organization(
             db,
             event_id=event_id,
@@ -2995,15 +3444,4 @@ def set_organization_event_delegates(
             events=events,
             settings=site_settings,
         )
-    except RegistrationError as exc:
-        db.rollback()
-        detail = str(exc)
-        lowered = detail.lower()
-        if "nem található" in lowered:
-            status_code = status.HTTP_404_NOT_FOUND
-        else:
-            status_code = status.HTTP_400_BAD_REQUEST
-        raise HTTPException(status_code=status_code, detail=detail) from exc
-
-    db.commit()
-    return detail
+    return PydanticResponse(detail)
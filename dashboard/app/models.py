@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import enum
-import uuid
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -11,13 +11,46 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
+    func,
 )
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.functions import FunctionElement
 
-from .database import Base
+from .database import DATABASE_URL, Base
+
+
+TOKEN_BYTES = 18
+
+
+def new_token() -> str:
+    return secrets.token_urlsafe(TOKEN_BYTES)
+
+
+# SQLite cannot add a DEFAULT to an existing column, so app.db files created
+# before the server-side timestamps still need the value from Python.
+PYTHON_TIMESTAMP_DEFAULT = (
+    datetime.utcnow if DATABASE_URL.startswith("sqlite") else None
+)
+
+
+class UtcNow(FunctionElement):
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kwargs) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(UtcNow)
+def _compile_utcnow(element, compiler, **kwargs) -> str:
+    return "CURRENT_TIMESTAMP"
 
 
 class VerificationStatus(str, enum.Enum):
@@ -49,17 +82,24 @@ class Organization(Base):
 
     users = relationship("User", back_populates="organization")
     event_delegates = relationship(
-        "EventDelegate", back_populates="organization", cascade="all, delete-orphan"
+        "EventDelegate",
+        back_populates="organization",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     invitations = relationship(
         "OrganizationInvitation",
         back_populates="organization",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_org_delegate", "organization_id", "is_voting_delegate"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
@@ -71,8 +111,19 @@ class User(Base):
     is_email_verified = Column(Boolean, default=False, nullable=False)
     is_admin = Column(Boolean, default=False, nullable=False)
     admin_decision = Column(Enum(ApprovalDecision), default=ApprovalDecision.pending, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
+    updated_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
     is_voting_delegate = Column(Boolean, default=False, nullable=False)
     must_change_password = Column(Boolean, default=False, nullable=False)
     seed_password_changed_at = Column(DateTime, nullable=True)
@@ -108,25 +159,31 @@ class EmailVerificationToken(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    token = Column(String, unique=True, nullable=False, default=lambda: str(uuid.uuid4()))
+    token = Column(String, unique=True, nullable=False, default=new_token)
     status = Column(Enum(VerificationStatus), default=VerificationStatus.pending, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
     confirmed_at = Column(DateTime, nullable=True)
 
     user = relationship("User", back_populates="verification_tokens")
 
-    @staticmethod
-    def new_token() -> str:
-        return str(uuid.uuid4())
-
 
 class PasswordResetToken(Base):
     __tablename__ = "password_reset_tokens"
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    token = Column(String, unique=True, nullable=False, default=lambda: uuid.uuid4().hex)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    token = Column(String, unique=True, nullable=False, default=new_token)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
     expires_at = Column(DateTime, nullable=False)
     used_at = Column(DateTime, nullable=True)
 
@@ -142,8 +199,13 @@ class SessionToken(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    token = Column(String, unique=True, nullable=False, default=lambda: uuid.uuid4().hex)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    token = Column(String, unique=True, nullable=False, default=new_token)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
 
     user = relationship("User")
 
@@ -160,9 +222,18 @@ class VotingEvent(Base):
     is_voting_enabled = Column(Boolean, default=False, nullable=False)
     delegate_limit = Column(Integer, nullable=True)
     delegate_lock_override = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        onupdate=datetime.utcnow,
+        nullable=False,
     )
 
     delegates = relationship(
@@ -177,15 +248,24 @@ class EventDelegate(Base):
     __tablename__ = "event_delegates"
     __table_args__ = (
         UniqueConstraint("event_id", "user_id", name="uq_event_user"),
+        Index("ix_event_delegates_event_org", "event_id", "organization_id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("voting_events.id"), nullable=False, index=True)
     organization_id = Column(
-        Integer, ForeignKey("organizations.id"), nullable=False, index=True
+        Integer,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
 
     event = relationship("VotingEvent", back_populates="delegates")
     organization = relationship("Organization", back_populates="event_delegates")
@@ -198,7 +278,12 @@ class VotingAccessCode(Base):
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("voting_events.id"), nullable=False, index=True)
     code = Column(String, unique=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
     used_at = Column(DateTime, nullable=True)
     used_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
 
@@ -214,17 +299,34 @@ class SiteSettings(Base):
     bank_account_number = Column(String, nullable=True)
 
 
+class SchemaMeta(Base):
+    __tablename__ = "schema_meta"
+
+    id = Column(Integer, primary_key=True, default=1)
+    version = Column(Integer, nullable=False)
+
+
 class OrganizationInvitation(Base):
     __tablename__ = "organization_invitations"
 
     id = Column(Integer, primary_key=True, index=True)
-    organization_id = Column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
+    organization_id = Column(
+        Integer,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     email = Column(String, nullable=False, index=True)
-    token = Column(String, unique=True, nullable=False, default=lambda: uuid.uuid4().hex)
+    token = Column(String, unique=True, nullable=False, default=new_token)
     role = Column(Enum(InvitationRole), nullable=False)
     invited_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     accepted_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime,
+        default=PYTHON_TIMESTAMP_DEFAULT,
+        server_default=UtcNow(),
+        nullable=False,
+    )
     accepted_at = Column(DateTime, nullable=True)
     first_name = Column(String, nullable=True)
     last_name = Column(String, nullable=True)
@@ -236,3 +338,14 @@ class OrganizationInvitation(Base):
     accepted_by_user = relationship(
         "User", back_populates="accepted_invitations", foreign_keys=[accepted_by_user_id]
     )
+
+
+Index(
+    "uq_pending_invite",
+    OrganizationInvitation.organization_id,
+    func.lower(OrganizationInvitation.email),
+    OrganizationInvitation.role,
+    unique=True,
+    postgresql_where=OrganizationInvitation.accepted_at.is_(None),
+    sqlite_where=OrganizationInvitation.accepted_at.is_(None),
+)
@@ -6,6 +6,7 @@ from typing import Literal, Optional
 from pydantic import AnyHttpUrl, BaseModel, EmailStr, Field, constr
 
 from .models import ApprovalDecision, InvitationRole
+from .security import MAX_PASSWORD_BYTES
 
 
 DelegateLockMode = Literal["auto", "locked", "unlocked"]
@@ -27,7 +28,7 @@ class RegistrationRequest(BaseModel):
     email: EmailStr
     first_name: constr(strip_whitespace=True, min_length=1, max_length=100)
     last_name: constr(strip_whitespace=True, min_length=1, max_length=100)
-    password: constr(min_length=8)
+    password: constr(min_length=8, max_length=MAX_PASSWORD_BYTES)
     organization_id: int
     captcha_token: Optional[str] = None
 
@@ -42,7 +43,7 @@ class VerificationResponse(BaseModel):
 
 class LoginRequest(BaseModel):
     email: EmailStr
-    password: str
+    password: constr(max_length=MAX_PASSWORD_BYTES)
 
 
 class LoginResponse(BaseModel):
@@ -201,10 +202,25 @@ class OrganizationDetail(BaseModel):
     upcoming_events: list[OrganizationEventAssignment] = Field(default_factory=list)
 
 
+class OrganizationSummary(BaseModel):
+    id: int
+    name: str
+    fee_paid: bool
+    member_count: int
+    bank_name: Optional[str] = None
+    bank_account_number: Optional[str] = None
+    payment_instructions: Optional[str] = None
+
+
 class OrganizationFeeUpdate(BaseModel):
     fee_paid: bool
 
 
+class OrganizationUpdateAck(BaseModel):
+    ok: bool = True
+    id: int
+
+
 class OrganizationBillingUpdate(BaseModel):
     bank_name: Optional[str] = None
     bank_account_number: Optional[str] = None
@@ -338,7 +354,7 @@ class InvitationCreateRequest(BaseModel):
 class InvitationAcceptRequest(BaseModel):
     first_name: constr(strip_whitespace=True, min_length=1, max_length=100)
     last_name: constr(strip_whitespace=True, min_length=1, max_length=100)
-    password: constr(min_length=8)
+    password: constr(min_length=8, max_length=MAX_PASSWORD_BYTES)
 
 
 class EventDelegateMember(BaseModel):
@@ -374,7 +390,7 @@ class VotingO2AuthLaunchRequest(BaseModel):
 
 class VotingAuthRequest(BaseModel):
     email: EmailStr
-    password: str
+    password: constr(max_length=MAX_PASSWORD_BYTES)
     timestamp: int
     signature: constr(strip_whitespace=True, min_length=1)
     code: Optional[constr(strip_whitespace=True, max_length=64)] = None
@@ -393,8 +409,8 @@ class VotingAuthResponse(BaseModel):
 
 
 class PasswordChangeRequest(BaseModel):
-    current_password: constr(min_length=1)
-    new_password: constr(min_length=8)
+    current_password: constr(min_length=1, max_length=MAX_PASSWORD_BYTES)
+    new_password: constr(min_length=8, max_length=MAX_PASSWORD_BYTES)
 
 
 class PasswordChangeResponse(BaseModel):
@@ -414,4 +430,4 @@ class PasswordResetVerifyResponse(BaseModel):
 
 class PasswordResetConfirmRequest(BaseModel):
     token: constr(strip_whitespace=True, min_length=1)
-    password: constr(min_length=8)
+    password: constr(min_length=8, max_length=MAX_PASSWORD_BYTES)
@@ -1,15 +1,236 @@
+import asyncio
+import base64
 import hashlib
+import hmac
 import os
-from typing import Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 
+from argon2 import PasswordHasher, extract_parameters
+from argon2.exceptions import InvalidHashError, VerificationError
 
-def hash_password(password: str, *, salt: str | None = None) -> Tuple[str, str]:
-    if salt is None:
-        salt = os.urandom(16).hex()
-    digest = hashlib.sha256(f"{salt}:{password}".encode()).hexdigest()
-    return salt, digest
 
+# Argon2id hashes embed their own salt and parameters, so the salt column
+# only records the scheme for them.
+ARGON2_SCHEME = "argon2id"
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST_KIB = 19 * 1024
+ARGON2_PARALLELISM = 1
+# Opt-in so every deployment hashes identically unless asked otherwise.
+CALIBRATE_ARGON2 = os.getenv("CALIBRATE_ARGON2", "0").strip() == "1"
+ARGON2_TARGET_MILLISECONDS = float(os.getenv("ARGON2_TARGET_MILLISECONDS", "50"))
+# PBKDF2 hashes from before the Argon2id switch still verify and are then
+# rehashed. Schemes ending in ".b64" store the salt as unpadded URL-safe
+# base64, the older ones as hex.
+PBKDF2_DIGESTS = {
+    "pbkdf2_sha256": "sha256",
+    "pbkdf2_sha512": "sha512",
+    "pbkdf2_sha512.b64": "sha512",
+}
+# Nothing legitimate comes close to this, and it keeps a huge password from
+# making every attempt pay for hashing it.
+MAX_PASSWORD_BYTES = 1024
+LEGACY_SCHEME = "sha256"
+PASSWORD_VERIFY_CACHE_MAX_ENTRIES = 4096
 
-def verify_password(password: str, salt: str, stored_hash: str) -> bool:
-    _, digest = hash_password(password, salt=salt)
-    return digest == stored_hash
+
+class PasswordCheckResult(NamedTuple):
+    is_valid: bool
+    needs_rehash: bool
+    scheme: str
+
+
+class _VerifyCache:
+    # Remembers successful verifications under an HMAC fingerprint keyed with
+    # a per-process secret, so entries cannot be brute-forced like a fast
+    # unsalted hash. The stored hash is part of the fingerprint; a password
+    # change therefore never matches an old entry.
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._secret = os.urandom(32)
+        self._entries: dict[bytes, None] = {}
+
+    def fingerprint(self, password: bytes, salt: str, stored_hash: str) -> bytes:
+        message = b"\0".join(
+            (salt.encode("utf-8"), stored_hash.encode("utf-8"), password)
+        )
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        return fingerprint in self._entries
+
+    def add(self, fingerprint: bytes) -> None:
+        with self._lock:
+            if fingerprint in self._entries:
+                return
+            if len(self._entries) >= self._maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[fingerprint] = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._secret = os.urandom(32)
+            self._entries = {}
+
+    def _reset_after_fork(self) -> None:
+        # The parent's lock may have been held by another thread at fork
+        # time, so the child replaces it instead of acquiring it.
+        self._lock = threading.Lock()
+        self._secret = os.urandom(32)
+        self._entries = {}
+
+
+_verify_cache = _VerifyCache(PASSWORD_VERIFY_CACHE_MAX_ENTRIES)
+os.register_at_fork(after_in_child=_verify_cache._reset_after_fork)
+
+
+def _calibrated_argon2_time_cost() -> int:
+    # Each pass fills the whole memory block once, so cost scales about
+    # linearly with time_cost; never drop below the configured floor.
+    if not CALIBRATE_ARGON2:
+        return ARGON2_TIME_COST
+    probe = PasswordHasher(
+        time_cost=1,
+        memory_cost=ARGON2_MEMORY_COST_KIB,
+        parallelism=ARGON2_PARALLELISM,
+    )
+    started = time.perf_counter()
+    probe.hash(b"calibration")
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return max(ARGON2_TIME_COST, int(ARGON2_TARGET_MILLISECONDS / elapsed_ms))
+
+
+_argon2_hasher = PasswordHasher(
+    time_cost=_calibrated_argon2_time_cost(),
+    memory_cost=ARGON2_MEMORY_COST_KIB,
+    parallelism=ARGON2_PARALLELISM,
+)
+
+# Both argon2 and pbkdf2_hmac release the GIL, so one worker per core hashes
+# in parallel without tying up the request threadpool or the event loop.
+_PASSWORD_HASHING_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+
+def hash_password(password: str) -> Tuple[str, str]:
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > MAX_PASSWORD_BYTES:
+        raise ValueError(f"Password is longer than {MAX_PASSWORD_BYTES} bytes")
+    return ARGON2_SCHEME, _argon2_hasher.hash(password_bytes)
+
+
+async def hash_password_async(password: str) -> Tuple[str, str]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PASSWORD_HASHING_POOL, hash_password, password)
+
+
+async def verify_password_async(
+    password: str, salt: str, stored_hash: str
+) -> PasswordCheckResult:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _PASSWORD_HASHING_POOL, verify_password, password, salt, stored_hash
+    )
+
+
+def verify_password(password: str, salt: str, stored_hash: str) -> PasswordCheckResult:
+    # Encoded once; the cache fingerprint and whichever hash runs share it.
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > MAX_PASSWORD_BYTES:
+        return PasswordCheckResult(
+            is_valid=False, needs_rehash=False, scheme=ARGON2_SCHEME
+        )
+    if salt != ARGON2_SCHEME:
+        return _verify_legacy(password_bytes, salt, stored_hash)
+    fingerprint = _verify_cache.fingerprint(password_bytes, salt, stored_hash)
+    if fingerprint in _verify_cache:
+        return PasswordCheckResult(
+            is_valid=True, needs_rehash=False, scheme=ARGON2_SCHEME
+        )
+    try:
+        _argon2_hasher.verify(stored_hash, password_bytes)
+    except (VerificationError, InvalidHashError):
+        return PasswordCheckResult(
+            is_valid=False, needs_rehash=False, scheme=ARGON2_SCHEME
+        )
+    needs_rehash = _argon2_needs_rehash(stored_hash)
+    if not needs_rehash:
+        _verify_cache.add(fingerprint)
+    return PasswordCheckResult(
+        is_valid=True, needs_rehash=needs_rehash, scheme=ARGON2_SCHEME
+    )
+
+
+def _argon2_needs_rehash(stored_hash: str) -> bool:
+    # Compared against the configured floor rather than the hasher, so a
+    # calibrated pass count on one host never downgrades or churns hashes
+    # written by another.
+    parameters = extract_parameters(stored_hash)
+    return (
+        parameters.time_cost < ARGON2_TIME_COST
+        or parameters.memory_cost < ARGON2_MEMORY_COST_KIB
+    )
+
+
+def _verify_legacy(password: bytes, salt: str, stored_hash: str) -> PasswordCheckResult:
+    parsed = _parse_pbkdf2_salt(salt)
+    if parsed is None:
+        return _verify_legacy_sha256(password, salt, stored_hash)
+    scheme, salt_bytes, iterations = parsed
+    digest = _hash_pbkdf2(
+        password, scheme=scheme, salt_bytes=salt_bytes, iterations=iterations
+    )
+    is_valid = hmac.compare_digest(digest, stored_hash)
+    return PasswordCheckResult(is_valid=is_valid, needs_rehash=is_valid, scheme=scheme)
+
+
+def _verify_legacy_sha256(
+    password: bytes, salt: str, stored_hash: str
+) -> PasswordCheckResult:
+    # Accounts created before PBKDF2 store a bare hex salt and a single
+    # SHA-256 round of "<salt>:<password>"; they are rehashed on the next
+    # successful login.
+    digest = hashlib.sha256(salt.encode("utf-8") + b":" + password).hexdigest()
+    is_valid = hmac.compare_digest(digest, stored_hash)
+    return PasswordCheckResult(
+        is_valid=is_valid, needs_rehash=is_valid, scheme=LEGACY_SCHEME
+    )
+
+
+def _hash_pbkdf2(
+    password: bytes, *, scheme: str, salt_bytes: bytes, iterations: int
+) -> str:
+    # hashlib runs the whole iteration loop inside OpenSSL, which picks the
+    # fastest implementation of the digest the CPU supports.
+    return hashlib.pbkdf2_hmac(
+        PBKDF2_DIGESTS[scheme], password, salt_bytes, iterations
+    ).hex()
+
+
+def _decode_pbkdf2_salt(scheme: str, salt_text: str) -> bytes:
+    if scheme.endswith(".b64"):
+        return base64.urlsafe_b64decode(salt_text + "=" * (-len(salt_text) % 4))
+    return bytes.fromhex(salt_text)
+
+
+@lru_cache(maxsize=8192)
+def _parse_pbkdf2_salt(salt: str) -> Optional[Tuple[str, bytes, int]]:
+    # Pure function of the stored salt string, so repeated logins reuse the
+    # decoded salt instead of parsing it again.
+    scheme, separator, rest = salt.partition("$")
+    if not separator or scheme not in PBKDF2_DIGESTS:
+        return None
+    iterations_text, separator, salt_text = rest.partition("$")
+    if not separator:
+        return None
+    try:
+        iterations = int(iterations_text)
+        salt_bytes = _decode_pbkdf2_salt(scheme, salt_text)
+    except ValueError:
+        return None
+    return scheme, salt_bytes, iterations
@@ -4,13 +4,14 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 from io import BytesIO
-from typing import Iterable, List, Literal, Optional
+from typing import Hashable, Iterator, List, Literal, Optional, Sequence
 from zipfile import BadZipFile, ZipFile
 
 import logging
 import secrets
 import string
-import uuid
+import threading
+import time
 
 import httpx
 
@@ -20,9 +21,11 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen import canvas
 
-from sqlalchemy import case, delete, func, select
+from sqlalchemy import Select, bindparam, case, delete, func, select, true, update
+from sqlalchemy.engine import Row
+from sqlalchemy.event import listens_for
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
 
 from zoneinfo import ZoneInfo
 
@@ -40,8 +43,9 @@ from .models import (
     VerificationStatus,
     VotingAccessCode,
     VotingEvent,
+    new_token,
 )
-from .security import hash_password, verify_password
+from .security import MAX_PASSWORD_BYTES, hash_password, verify_password
 
 
 logger = logging.getLogger(__name__)
@@ -68,6 +72,9 @@ ACCESS_CODE_ALPHABET = "23456789ABCDEFGHJKLMNPQRSTUVWXYZ"
 ACCESS_CODE_LENGTH = 8
 ACCESS_CODES_PER_PAGE = 16
 SITE_SETTINGS_SINGLETON_ID = 1
+ACTIVE_EVENT_CACHE_TTL_SECONDS = 15.0
+ORGANIZATION_LIST_CACHE_TTL_SECONDS = 15.0
+ORGANIZATION_LIST_CACHE_MAX_ENTRIES = 256
 
 
 def _parse_elms_sans_zip(payload: bytes) -> dict[str, bytes]:
@@ -230,10 +237,18 @@ class RegistrationError(Exception):
     pass
 
 
+class NotFoundError(RegistrationError):
+    pass
+
+
 class AuthenticationError(Exception):
     pass
 
 
+class AccountNotActiveError(AuthenticationError):
+    pass
+
+
 class PasswordResetError(Exception):
     pass
 
@@ -248,17 +263,31 @@ class VotingAccessCodeUnavailableError(VotingAccessCodeError):
     pass
 
 
-def search_organizations(session: Session, query: Optional[str] = None) -> List[Organization]:
-    stmt = select(Organization)
+def search_organizations_statement(query: Optional[str] = None) -> Select:
+    stmt = select(
+        Organization.id,
+        Organization.name,
+        Organization.fee_paid,
+        Organization.bank_name,
+        Organization.bank_account_number,
+        Organization.payment_instructions,
+    )
     if query:
         stmt = stmt.where(func.lower(Organization.name).contains(query.lower()))
-    stmt = stmt.order_by(Organization.name.asc()).limit(20)
-    return list(session.scalars(stmt))
+    return stmt.order_by(Organization.name.asc()).limit(20)
+
+
+def validate_password_length(password: str) -> None:
+    if len(password.encode("utf-8")) > MAX_PASSWORD_BYTES:
+        raise RegistrationError(
+            f"A jelszó legfeljebb {MAX_PASSWORD_BYTES} bájt hosszú lehet."
+        )
 
 
 def validate_password_strength(password: str) -> None:
     if len(password) < 8:
         raise RegistrationError("A jelszónak legalább 8 karakter hosszúnak kell lennie.")
+    validate_password_length(password)
     if not any(character.isupper() for character in password):
         raise RegistrationError("A jelszónak tartalmaznia kell legalább egy nagybetűt.")
     if not any(not character.isalnum() for character in password):
@@ -274,15 +303,16 @@ def register_user(
     password: str,
     organization_id: int,
     is_admin: bool = False,
+    canonical_email: Optional[str] = None,
 ) -> EmailVerificationToken:
     validate_password_strength(password)
     organization = session.get(Organization, organization_id)
     if not organization:
-        raise RegistrationError("Nem található a kiválasztott szervezet")
+        raise NotFoundError("Nem található a kiválasztott szervezet")
 
     salt, password_hash = hash_password(password)
     user = User(
-        email=email.lower(),
+        email=canonical_email or email.lower(),
         first_name=first_name,
         last_name=last_name,
         password_hash=password_hash,
@@ -299,7 +329,7 @@ def register_user(
     except IntegrityError as exc:
         raise RegistrationError("Ezzel az e-mail címmel már létezik felhasználó") from exc
 
-    token_value = EmailVerificationToken.new_token()
+    token_value = new_token()
     token = EmailVerificationToken(user=user, token=token_value)
     session.add(token)
     return token
@@ -462,7 +492,7 @@ def reset_admin_temporary_password(
 ) -> tuple[User, str]:
     user = session.get(User, user_id)
     if user is None or not user.is_admin:
-        raise RegistrationError("Nem található adminisztrátori fiók.")
+        raise NotFoundError("Nem található adminisztrátori fiók.")
 
     password = _generate_admin_password()
     salt, password_hash = hash_password(password)
@@ -481,7 +511,7 @@ def delete_admin_account(
 ) -> None:
     admin_user = session.get(User, admin_id)
     if admin_user is None or not admin_user.is_admin:
-        raise RegistrationError("Nem található adminisztrátori fiók.")
+        raise NotFoundError("Nem található adminisztrátori fiók.")
 
     if acting_admin_id is not None and admin_user.id == acting_admin_id:
         raise RegistrationError("A saját adminisztrátori fiókodat nem törölheted.")
@@ -914,27 +944,46 @@ def create_session_token(session: Session, *, user: User) -> SessionToken:
 
 
 def resolve_session_user(session: Session, token_value: str) -> Optional[User]:
-    stmt = select(SessionToken).where(SessionToken.token == token_value)
-    session_token = session.scalar(stmt)
-    if not session_token:
-        return None
-    return session_token.user
+    stmt = (
+        select(User)
+        .join(SessionToken, SessionToken.user_id == User.id)
+        .where(SessionToken.token == token_value)
+        .options(joinedload(User.organization))
+        .limit(1)
+    )
+    return session.scalar(stmt)
+
+
+INVALID_LOGIN_MESSAGE = "Hibás bejelentkezési adatok"
 
 
 def authenticate_user(session: Session, *, email: str, password: str) -> User:
     stmt = select(User).where(User.email == email.lower())
     user = session.scalar(stmt)
     if not user:
-        raise AuthenticationError("Hibás bejelentkezési adatok")
-    if not verify_password(password, user.password_salt, user.password_hash):
-        raise AuthenticationError("Hibás bejelentkezési adatok")
+        raise AuthenticationError(INVALID_LOGIN_MESSAGE)
+    check = verify_password(password, user.password_salt, user.password_hash)
+    if not check.is_valid:
+        raise AuthenticationError(INVALID_LOGIN_MESSAGE)
+    ensure_user_can_log_in(user)
+    if check.needs_rehash:
+        user.password_salt, user.password_hash = hash_password(password)
+    return user
+
+
+def login_credentials_statement(email: str) -> Select:
+    return select(User.id, User.password_salt, User.password_hash).where(
+        User.email == email.lower()
+    )
+
+
+def ensure_user_can_log_in(user: User) -> None:
     if not user.is_email_verified:
-        raise AuthenticationError("Bejelentkezés előtt erősítsd meg az e-mail címedet")
+        raise AccountNotActiveError("Bejelentkezés előtt erősítsd meg az e-mail címedet")
     if user.admin_decision == ApprovalDecision.denied:
-        raise AuthenticationError("A regisztrációs kérelmed el lett utasítva")
+        raise AccountNotActiveError("A regisztrációs kérelmed el lett utasítva")
     if user.admin_decision != ApprovalDecision.approved:
-        raise AuthenticationError("A fiókod adminisztrátori jóváhagyásra vár")
-    return user
+        raise AccountNotActiveError("A fiókod adminisztrátori jóváhagyásra vár")
 
 
 def change_user_password(
@@ -944,7 +993,9 @@ def change_user_password(
     current_password: str,
     new_password: str,
 ) -> SessionToken:
-    if not verify_password(current_password, user.password_salt, user.password_hash):
+    if not verify_password(
+        current_password, user.password_salt, user.password_hash
+    ).is_valid:
         raise AuthenticationError("A jelenlegi jelszó nem megfelelő")
 
     validate_password_strength(new_password)
@@ -959,19 +1010,27 @@ def change_user_password(
     return create_session_token(session, user=user)
 
 
-def pending_registrations(session: Session) -> Iterable[User]:
-    stmt = (
-        select(User)
+def pending_registrations_statement() -> Select:
+    return (
+        select(
+            User.id,
+            User.email,
+            User.first_name,
+            User.last_name,
+            User.is_email_verified,
+            User.created_at,
+            Organization.name.label("organization_name"),
+        )
+        .outerjoin(Organization, User.organization_id == Organization.id)
         .where(User.admin_decision == ApprovalDecision.pending)
         .order_by(User.is_email_verified.asc(), User.created_at.asc())
     )
-    return session.scalars(stmt)
 
 
 def decide_registration(session: Session, *, user_id: int, approve: bool) -> User:
     user = session.get(User, user_id)
     if not user:
-        raise RegistrationError("Nem található felhasználó")
+        raise NotFoundError("Nem található felhasználó")
     if user.admin_decision != ApprovalDecision.pending:
         return user
 
@@ -1012,71 +1071,150 @@ def create_organization(
 
 
 def delete_organization(session: Session, *, organization_id: int) -> None:
-    organization = session.get(Organization, organization_id)
-    if organization is None:
-        raise RegistrationError("Nem található szervezet")
-    if organization.users:
-        raise RegistrationError(
-            "A szervezet addig nem törölhető, amíg vannak hozzárendelt tagok."
+    # PostgreSQL removes delegates and invitations through ON DELETE CASCADE;
+    # SQLite does not enforce foreign keys, so the children go first there and
+    # a refused delete raises for the caller to roll back.
+    if session.get_bind().dialect.name != "postgresql":
+        session.execute(
+            delete(EventDelegate).where(EventDelegate.organization_id == organization_id)
+        )
+        session.execute(
+            delete(OrganizationInvitation).where(
+                OrganizationInvitation.organization_id == organization_id
+            )
         )
-    session.delete(organization)
+    deleted_id = session.scalar(
+        delete(Organization)
+        .where(
+            Organization.id == organization_id,
+            ~select(User.id).where(User.organization_id == organization_id).exists(),
+        )
+        .returning(Organization.id)
+    )
+    if deleted_id is not None:
+        return
+    if session.get(Organization, organization_id) is None:
+        raise NotFoundError("Nem található szervezet")
+    raise RegistrationError(
+        "A szervezet addig nem törölhető, amíg vannak hozzárendelt tagok."
+    )
+
+
+ORGANIZATION_MEMBER_COLUMNS = (
+    User.id,
+    User.organization_id,
+    User.email,
+    User.first_name,
+    User.last_name,
+    User.is_admin,
+    User.is_email_verified,
+    User.admin_decision,
+    User.is_voting_delegate,
+    User.is_organization_contact,
+)
 
+ORGANIZATION_DETAIL_LOAD_OPTIONS = (
+    selectinload(Organization.users).load_only(*ORGANIZATION_MEMBER_COLUMNS),
+    selectinload(Organization.event_delegates)
+    .selectinload(EventDelegate.user)
+    .load_only(User.id, User.email, User.first_name, User.last_name),
+    selectinload(Organization.invitations).selectinload(
+        OrganizationInvitation.invited_by_user
+    ),
+    raiseload("*"),
+)
 
-def organizations_with_members(session: Session) -> List[Organization]:
+# Everything build_event_read touches, loaded together with the event so the
+# event write endpoints can answer without a refresh.
+EVENT_READ_LOAD_OPTIONS = (
+    selectinload(VotingEvent.delegates).load_only(EventDelegate.user_id),
+    selectinload(VotingEvent.access_codes).load_only(VotingAccessCode.used_at),
+)
+
+# Built once so the detail lookup only binds the id per request instead of
+# rebuilding the statement and its loader options.
+ORGANIZATION_DETAIL_STATEMENT = (
+    select(Organization)
+    .where(Organization.id == bindparam("organization_id"))
+    .options(*ORGANIZATION_DETAIL_LOAD_OPTIONS)
+)
+
+
+def organizations_with_members(
+    session: Session, *, load_options: Sequence = ORGANIZATION_DETAIL_LOAD_OPTIONS
+) -> List[Organization]:
     stmt = (
         select(Organization)
-        .options(
-            selectinload(Organization.users),
-            selectinload(Organization.event_delegates).selectinload(EventDelegate.user),
-            selectinload(Organization.invitations).selectinload(
-                OrganizationInvitation.invited_by_user
-            ),
-        )
+        .options(*load_options)
         .order_by(Organization.name.asc())
     )
     return list(session.scalars(stmt))
 
 
+def iter_organizations_with_members(
+    session: Session,
+    *,
+    batch_size: int = 128,
+    load_options: Sequence = ORGANIZATION_DETAIL_LOAD_OPTIONS,
+) -> Iterator[Organization]:
+    stmt = (
+        select(Organization)
+        .options(*load_options)
+        .order_by(Organization.name.asc())
+        .execution_options(yield_per=batch_size)
+    )
+    yield from session.scalars(stmt)
+
+
+def iter_organization_members(
+    session: Session, organization_id: int, *, batch_size: int = 256
+) -> Iterator[User]:
+    stmt = (
+        select(User)
+        .where(User.organization_id == organization_id)
+        .options(load_only(*ORGANIZATION_MEMBER_COLUMNS), raiseload("*"))
+        .order_by(User.id.asc())
+        .execution_options(yield_per=batch_size)
+    )
+    yield from session.scalars(stmt)
+
+
 def set_organization_fee_status(
     session: Session, *, organization_id: int, fee_paid: bool
 ) -> Organization:
     organization = session.get(Organization, organization_id)
     if organization is None:
-        raise RegistrationError("Nem található szervezet")
+        raise NotFoundError("Nem található szervezet")
     organization.fee_paid = fee_paid
     return organization
 
 
-def set_voting_delegate(
-    session: Session, *, user_id: int, is_delegate: bool
-) -> User:
-    user = session.get(User, user_id)
-    if user is None:
-        raise RegistrationError("Nem található felhasználó")
-    if user.is_admin:
-        raise RegistrationError(
-            "Az adminisztrátorok jogosultsága nem módosítható ezen a felületen."
+def organization_with_members(
+    session: Session,
+    organization_id: int,
+    *,
+    load_options: Sequence = ORGANIZATION_DETAIL_LOAD_OPTIONS,
+) -> Organization:
+    if load_options is ORGANIZATION_DETAIL_LOAD_OPTIONS:
+        stmt = ORGANIZATION_DETAIL_STATEMENT
+    else:
+        stmt = (
+            select(Organization)
+            .where(Organization.id == bindparam("organization_id"))
+            .options(*load_options)
         )
-    user.is_voting_delegate = is_delegate
-    return user
+    organization = session.scalar(stmt, {"organization_id": organization_id})
+    if organization is None:
+        raise NotFoundError("Nem található szervezet")
+    return organization
 
 
-def organization_with_members(session: Session, organization_id: int) -> Organization:
-    stmt = (
-        select(Organization)
-        .where(Organization.id == organization_id)
-        .options(
-            selectinload(Organization.users),
-            selectinload(Organization.event_delegates).selectinload(EventDelegate.user),
-            selectinload(Organization.invitations).selectinload(
-                OrganizationInvitation.invited_by_user
-            ),
-        )
+def organization_member_count(session: Session, organization_id: int) -> int:
+    return session.scalar(
+        select(func.count())
+        .select_from(User)
+        .where(User.organization_id == organization_id)
     )
-    organization = session.scalar(stmt)
-    if organization is None:
-        raise RegistrationError("Nem található szervezet")
-    return organization
 
 
 def sanitize_optional_text(value: Optional[str]) -> Optional[str]:
@@ -1196,9 +1334,9 @@ def delegate_lock_state(
 def set_delegate_lock_override(
     session: Session, event_id: int, *, mode: DelegateLockMode
 ) -> VotingEvent:
-    event = session.get(VotingEvent, event_id)
+    event = session.get(VotingEvent, event_id, options=EVENT_READ_LOAD_OPTIONS)
     if event is None:
-        raise RegistrationError("Nem található szavazási esemény")
+        raise NotFoundError("Nem található szavazási esemény")
 
     if mode == "auto":
         event.delegate_lock_override = None
@@ -1251,7 +1389,7 @@ def generate_voting_access_codes(
 ) -> list[VotingAccessCode]:
     event = session.get(VotingEvent, event_id)
     if event is None:
-        raise RegistrationError("Nem található szavazási esemény")
+        raise NotFoundError("Nem található szavazási esemény")
 
     delegate_total = session.scalar(
         select(func.count(EventDelegate.id)).where(EventDelegate.event_id == event_id)
@@ -1431,13 +1569,14 @@ def list_voting_events(session: Session) -> List[VotingEvent]:
 
 
 def upcoming_voting_events(session: Session) -> List[VotingEvent]:
+    # Only feeds the per-organization assignment list, which reads delegates
+    # and their names but never the event's access codes.
     stmt = (
         select(VotingEvent)
         .options(
-            selectinload(VotingEvent.delegates).selectinload(EventDelegate.user),
-            selectinload(VotingEvent.access_codes).selectinload(
-                VotingAccessCode.used_by_user
-            ),
+            selectinload(VotingEvent.delegates)
+            .selectinload(EventDelegate.user)
+            .load_only(User.id, User.email, User.first_name, User.last_name),
         )
         .order_by(
             case((VotingEvent.event_date.is_(None), 1), else_=0),
@@ -1463,6 +1602,118 @@ def get_active_voting_event(session: Session) -> Optional[VotingEvent]:
     return session.scalar(stmt)
 
 
+_CACHE_MISS = object()
+
+
+class _TTLCache:
+    def __init__(self, ttl_seconds: float, *, maxsize: int = 1) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, object]] = {}
+        self.generation = 0
+
+    def get(self, key: Hashable = None, default: object = _CACHE_MISS) -> object:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def set(
+        self, value: object, key: Hashable = None, *, generation: int | None = None
+    ) -> None:
+        # Threadpool handlers share the cache; the lock keeps eviction and the
+        # generation check atomic with respect to other writers.
+        with self._lock:
+            # A write committed while the value was being built makes it stale.
+            if generation is not None and generation != self.generation:
+                return
+            if key not in self._entries and len(self._entries) >= self._maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self.generation += 1
+
+
+_active_event_id_cache = _TTLCache(ACTIVE_EVENT_CACHE_TTL_SECONDS)
+organization_list_cache = _TTLCache(
+    ORGANIZATION_LIST_CACHE_TTL_SECONDS, maxsize=ORGANIZATION_LIST_CACHE_MAX_ENTRIES
+)
+
+
+def invalidate_active_voting_event_cache() -> None:
+    _active_event_id_cache.invalidate()
+
+
+def invalidate_organization_list_cache() -> None:
+    organization_list_cache.invalidate()
+
+
+_ORGANIZATION_LIST_SOURCES = (
+    Organization,
+    User,
+    OrganizationInvitation,
+    EventDelegate,
+    VotingEvent,
+    SiteSettings,
+    VotingAccessCode,
+)
+_ORGANIZATION_LIST_DIRTY_KEY = "organization_list_dirty"
+
+
+@listens_for(Session, "after_flush")
+def _track_organization_list_changes(session: Session, _flush_context) -> None:
+    if session.info.get(_ORGANIZATION_LIST_DIRTY_KEY):
+        return
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, _ORGANIZATION_LIST_SOURCES):
+            session.info[_ORGANIZATION_LIST_DIRTY_KEY] = True
+            return
+
+
+@listens_for(Session, "do_orm_execute")
+def _track_organization_list_statements(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_ORGANIZATION_LIST_DIRTY_KEY] = True
+
+
+@listens_for(Session, "after_commit")
+def _expire_organization_list_cache(session: Session) -> None:
+    if session.info.pop(_ORGANIZATION_LIST_DIRTY_KEY, False):
+        invalidate_organization_list_cache()
+
+
+@listens_for(Session, "after_rollback")
+def _reset_organization_list_changes(session: Session) -> None:
+    session.info.pop(_ORGANIZATION_LIST_DIRTY_KEY, None)
+
+
+def cached_active_voting_event(session: Session) -> Optional[VotingEvent]:
+    event_id = _active_event_id_cache.get()
+    if event_id is not _CACHE_MISS:
+        if event_id is None:
+            return None
+        event = session.get(
+            VotingEvent,
+            event_id,
+            options=[
+                selectinload(VotingEvent.delegates).selectinload(EventDelegate.user),
+                selectinload(VotingEvent.access_codes).selectinload(
+                    VotingAccessCode.used_by_user
+                ),
+            ],
+        )
+        if event is not None and event.is_active:
+            return event
+
+    event = get_active_voting_event(session)
+    _active_event_id_cache.set(event.id if event else None)
+    return event
+
+
 def create_voting_event(
     session: Session,
     *,
@@ -1496,11 +1747,15 @@ def create_voting_event(
         is_active=False,
         is_voting_enabled=False,
         delegate_limit=delegate_limit,
+        delegates=[],
+        access_codes=[],
     )
     session.add(event)
     session.flush()
 
-    has_active = get_active_voting_event(session)
+    has_active = session.scalar(
+        select(VotingEvent.id).where(VotingEvent.is_active.is_(True)).limit(1)
+    )
     if activate or has_active is None:
         event = set_active_voting_event(session, event.id)
         if activate:
@@ -1521,7 +1776,7 @@ def update_voting_event(
 ) -> VotingEvent:
     event = session.get(VotingEvent, event_id)
     if event is None:
-        raise RegistrationError("Nem található szavazási esemény")
+        raise NotFoundError("Nem található szavazási esemény")
 
     cleaned_title = title.strip()
     if len(cleaned_title) < 3:
@@ -1550,14 +1805,19 @@ def update_voting_event(
 def set_active_voting_event(session: Session, event_id: int) -> VotingEvent:
     event = session.get(VotingEvent, event_id)
     if event is None:
-        raise RegistrationError("Nem található szavazási esemény")
+        raise NotFoundError("Nem található szavazási esemény")
 
-    stmt = select(VotingEvent)
-    for item in session.scalars(stmt):
-        item.is_active = item.id == event.id
-        if item.id != event.id and item.is_voting_enabled:
-            item.is_voting_enabled = False
+    session.execute(
+        update(VotingEvent)
+        .where(VotingEvent.id != event.id)
+        .where(
+            (VotingEvent.is_active.is_(True)) | (VotingEvent.is_voting_enabled.is_(True))
+        )
+        .values(is_active=False, is_voting_enabled=False)
+    )
+    event.is_active = True
     session.flush()
+    invalidate_active_voting_event_cache()
     synchronize_delegate_flags(session, event)
     return event
 
@@ -1565,9 +1825,9 @@ def set_active_voting_event(session: Session, event_id: int) -> VotingEvent:
 def set_voting_event_accessibility(
     session: Session, event_id: int, *, is_voting_enabled: bool
 ) -> VotingEvent:
-    event = session.get(VotingEvent, event_id)
+    event = session.get(VotingEvent, event_id, options=EVENT_READ_LOAD_OPTIONS)
     if event is None:
-        raise RegistrationError("Nem található szavazási esemény")
+        raise NotFoundError("Nem található szavazási esemény")
 
     if is_voting_enabled and not event.is_active:
         raise RegistrationError(
@@ -1582,13 +1842,14 @@ def set_voting_event_accessibility(
 def delete_voting_event(session: Session, *, event_id: int) -> None:
     event = session.get(VotingEvent, event_id)
     if event is None:
-        raise RegistrationError("Nem található szavazási esemény")
+        raise NotFoundError("Nem található szavazási esemény")
 
     if event.is_active:
         raise RegistrationError("Az aktív esemény nem törölhető.")
 
     session.delete(event)
     session.flush()
+    invalidate_active_voting_event_cache()
 
 
 def reset_voting_events(session: Session) -> int:
@@ -1598,6 +1859,7 @@ def reset_voting_events(session: Session) -> int:
 
     session.execute(delete(EventDelegate))
     session.execute(delete(VotingEvent))
+    invalidate_active_voting_event_cache()
 
     user_stmt = select(User).where(User.is_voting_delegate.is_(True))
     for user in session.scalars(user_stmt):
@@ -1631,7 +1893,7 @@ def set_event_delegates_for_organization(
 ) -> list[EventDelegate]:
     event = session.get(VotingEvent, event_id)
     if event is None:
-        raise RegistrationError("Nem található szavazási esemény")
+        raise NotFoundError("Nem található szavazási esemény")
 
     lock_state = delegate_lock_state(event)
     if lock_state.locked:
@@ -1639,7 +1901,7 @@ def set_event_delegates_for_organization(
 
     organization = session.get(Organization, organization_id)
     if organization is None:
-        raise RegistrationError("Nem található szervezet")
+        raise NotFoundError("Nem található szervezet")
 
     normalized_ids: list[int] = []
     seen: set[int] = set()
@@ -1658,7 +1920,7 @@ def set_event_delegates_for_organization(
     for user_id in normalized_ids:
         user = session.get(User, user_id)
         if user is None:
-            raise RegistrationError("Nem található felhasználó")
+            raise NotFoundError("Nem található felhasználó")
         _ensure_user_can_delegate(user)
         if user.organization_id != organization.id:
             raise RegistrationError(
@@ -1712,6 +1974,37 @@ def delegates_for_event(
     return delegates
 
 
+def event_delegate_rows(session: Session, *, event_id: int) -> list[Row]:
+    stmt = (
+        select(
+            Organization.id.label("organization_id"),
+            Organization.name.label("organization_name"),
+            User.id.label("user_id"),
+            User.email.label("user_email"),
+            User.first_name.label("user_first_name"),
+            User.last_name.label("user_last_name"),
+        )
+        # Anchoring the join on the event keeps one all-NULL row for an event
+        # without organizations, so an empty result means the event is missing.
+        .select_from(VotingEvent)
+        .outerjoin(Organization, true())
+        .outerjoin(
+            EventDelegate,
+            (EventDelegate.organization_id == Organization.id)
+            & (EventDelegate.event_id == VotingEvent.id),
+        )
+        .outerjoin(User, User.id == EventDelegate.user_id)
+        .where(VotingEvent.id == event_id)
+        .order_by(
+            Organization.name.asc(),
+            Organization.id.asc(),
+            EventDelegate.created_at.asc(),
+            EventDelegate.id.asc(),
+        )
+    )
+    return list(session.execute(stmt))
+
+
 def _pending_invitation_query(
     session: Session,
     *,
@@ -1755,7 +2048,7 @@ def _create_invitation(
         email=normalized_email,
         role=role,
     )
-    token = uuid.uuid4().hex
+    token = new_token()
 
     if invitation is None:
         invitation = OrganizationInvitation(
@@ -1773,7 +2066,12 @@ def _create_invitation(
     invitation.first_name = first_name.strip() if first_name else None
     invitation.last_name = last_name.strip() if last_name else None
 
-    session.flush()
+    try:
+        session.flush()
+    except IntegrityError as exc:
+        raise RegistrationError(
+            "Ehhez az e-mail címhez már tartozik függő meghívó."
+        ) from exc
     return invitation
 
 
@@ -1788,7 +2086,7 @@ def create_contact_invitation(
 ) -> tuple[OrganizationInvitation | None, User | None]:
     organization = session.get(Organization, organization_id)
     if organization is None:
-        raise RegistrationError("Nem található szervezet")
+        raise NotFoundError("Nem található szervezet")
 
     normalized_email = _normalize_email(email)
 
@@ -1848,7 +2146,7 @@ def create_member_invitation(
 ) -> OrganizationInvitation:
     organization = session.get(Organization, organization_id)
     if organization is None:
-        raise RegistrationError("Nem található szervezet")
+        raise NotFoundError("Nem található szervezet")
 
     if invited_by.organization_id != organization.id and not invited_by.is_admin:
         raise RegistrationError(
@@ -1904,7 +2202,7 @@ def accept_invitation(
 ) -> User:
     invitation = get_invitation_by_token(session, token=token)
     if invitation is None or invitation.accepted_at is not None:
-        raise RegistrationError("Érvénytelen vagy már felhasznált meghívó")
+        raise NotFoundError("Érvénytelen vagy már felhasznált meghívó")
 
     organization = invitation.organization
     if organization is None:
@@ -1923,6 +2221,7 @@ def accept_invitation(
         if existing_contact is not None:
             raise RegistrationError("Ehhez a szervezethez már tartozik kapcsolattartó")
 
+    validate_password_length(password)
     salt, password_hash = hash_password(password)
 
     user = User(
@@ -1956,11 +2255,11 @@ def remove_member_from_organization(
 ) -> None:
     organization = session.get(Organization, organization_id)
     if organization is None:
-        raise RegistrationError("Nem található szervezet")
+        raise NotFoundError("Nem található szervezet")
 
     member = session.get(User, member_id)
     if member is None or member.organization_id != organization_id:
-        raise RegistrationError("Nem található tag a szervezetben")
+        raise NotFoundError("Nem található tag a szervezetben")
 
     if member.is_admin:
         raise RegistrationError("Adminisztrátort nem lehet eltávolítani a szervezetből")
@@ -1978,16 +2277,42 @@ def remove_member_from_organization(
 
 
 def delete_user_account(session: Session, *, user_id: int) -> None:
-    user = session.get(User, user_id)
-    if user is None:
-        raise RegistrationError("Nem található felhasználó")
-    if user.is_admin:
-        raise RegistrationError("Adminisztrátori fiókot nem lehet törölni")
-    session.delete(user)
+    # Children go first; a refused delete raises and the caller rolls back.
+    for model in (EmailVerificationToken, PasswordResetToken, SessionToken, EventDelegate):
+        session.execute(delete(model).where(model.user_id == user_id))
+    session.execute(
+        update(OrganizationInvitation)
+        .where(OrganizationInvitation.invited_by_user_id == user_id)
+        .values(invited_by_user_id=None)
+    )
+    session.execute(
+        update(OrganizationInvitation)
+        .where(OrganizationInvitation.accepted_by_user_id == user_id)
+        .values(accepted_by_user_id=None)
+    )
+    session.execute(
+        update(VotingAccessCode)
+        .where(VotingAccessCode.used_by_user_id == user_id)
+        .values(used_by_user_id=None)
+    )
+    deleted_id = session.scalar(
+        delete(User)
+        .where(User.id == user_id, User.is_admin.is_(False))
+        .returning(User.id)
+    )
+    if deleted_id is not None:
+        return
+    if session.get(User, user_id) is None:
+        raise NotFoundError("Nem található felhasználó")
+    raise RegistrationError("Adminisztrátori fiókot nem lehet törölni")
 
 
-def verify_recaptcha(
-    token: str, *, secret: str, remote_ip: str | None = None
+async def verify_recaptcha(
+    token: str,
+    *,
+    secret: str,
+    client: httpx.AsyncClient,
+    remote_ip: str | None = None,
 ) -> None:
     if not token:
         raise RegistrationError("Kérjük, fejezd be a robot elleni ellenőrzést.")
@@ -1997,7 +2322,7 @@ def verify_recaptcha(
         payload["remoteip"] = remote_ip
 
     try:
-        response = httpx.post(
+        response = await client.post(
             "https://www.google.com/recaptcha/api/siteverify",
             data=payload,
             timeout=10.0,